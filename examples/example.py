@@ -203,13 +203,18 @@ def performance_example():
 
     print(f'필터링된 태그 수: {len(filtered_tags)}')
 
+    # 이미지별 태그 목록처럼 여러 목록을 한 번에 필터링
+    tag_batches = [large_tag_list[i : i + 50] for i in range(0, len(large_tag_list), 50)]
+    filtered_batches = engine.filter_tags_many(tag_batches)
+    print(f'목록 {len(tag_batches)}개 일괄 필터링 후 태그 수: {sum(map(len, filtered_batches))}')
+
     # 성능 통계 출력
     stats = engine.get_performance_stats()
-    print(f'처리된 태그 수: {stats["total_processed"]}')
-    print(f'제거된 태그 수: {stats["total_filtered"]}')
-    print(f'필터링 비율: {stats["filter_rate"]:.2%}')
-    print(f'처리 시간: {stats["processing_time"]:.4f}초')
-    print(f'평균 처리 시간: {stats["avg_processing_time"]:.6f}초/태그')
+    print(f'처리된 태그 수: {stats.total_processed}')
+    print(f'제거된 태그 수: {stats.total_filtered}')
+    print(f'필터링 비율: {stats.filter_rate:.2%}')
+    print(f'처리 시간: {stats.processing_time:.4f}초')
+    print(f'평균 처리 시간: {stats.avg_processing_time:.6f}초/태그')
     print()
 
 
@@ -16,7 +16,7 @@ from .base import (
     FilterType,
     GroupFilterRule,
 )
-from .config import ConfigLoader, TagFilterConfig
+from .config import ConfigLoader, InvalidFilterTypeError, NegativePriorityError, TagFilterConfig
 from .engine import OptimizedTagFilterEngine, TagFilterEngine, create_engine
 from .filters import FilterFactory
 
@@ -31,5 +31,7 @@ __all__ = [
     'FilterFactory',
     'TagFilterConfig',
     'ConfigLoader',
+    'InvalidFilterTypeError',
+    'NegativePriorityError',
     'create_engine',
 ]
@@ -19,6 +19,11 @@ class FilterType(StrEnum):
     REPLACE_CAPTURE = 'replace_capture'
 
 
+# 필터 타입별 정수 식별자
+# 자주 실행되는 분기에서 문자열 열거형 비교 대신 정수로 판별할 때 사용합니다.
+FILTER_KINDS: dict[str, int] = {filter_type: kind for kind, filter_type in enumerate(FilterType)}
+
+
 class FilterRule(NamedTuple):
     """기본 필터 규칙
 
@@ -59,14 +64,12 @@ class GroupFilterRule(NamedTuple):
         enabled: bool = True,
         description: Optional[str] = None,
     ) -> 'GroupFilterRule':
-        """리스트에서 GroupFilterRule 생성"""
-        return cls(
-            filter_type=FilterType.GROUP,
-            patterns=tuple(patterns),
-            priority=priority,
-            enabled=enabled,
-            description=description,
-        )
+        """리스트에서 GroupFilterRule 생성
+
+        중복된 패턴은 처음 나온 순서대로 한 번만 남깁니다. 순서는 유지되므로
+        ``['a', 'b']``와 ``['b', 'a']``는 서로 다른 규칙(및 해시)이 됩니다.
+        """
+        return cls._make((FilterType.GROUP, tuple(dict.fromkeys(patterns)), priority, enabled, description))
 
 
 class FilterInterface(Protocol):
@@ -96,17 +99,35 @@ class FilterInterface(Protocol):
 
 
 class BaseFilter(ABC):
-    """기본 필터 추상 클래스"""
+    """기본 필터 추상 클래스
+
+    인스턴스 속성은 ``__slots__``로 고정됩니다.
+    하위 클래스도 ``__slots__``를 선언해야 하며, 새 속성이 없으면 빈 튜플을 사용합니다.
+
+    추상 메서드 검사는 인스턴스 생성 시에만 일어나므로 ``apply``/``matches`` 호출 비용은
+    일반 클래스와 같습니다. 느린 ABC ``isinstance`` 검사는 엔진 구성 시에만 사용합니다.
+    """
+
+    __slots__ = ('_compiled_pattern', 'kind', 'rule')
 
     def __init__(self, rule: FilterRule):
         self.rule = rule
+        self.kind = FILTER_KINDS[rule.filter_type]
         self._compiled_pattern = None
 
     @abstractmethod
     def apply(self, tags: List[str]) -> List[str]:
-        """태그 목록에 필터를 적용"""
+        """태그 목록에 필터를 적용
+
+        엔진은 활성화된 규칙으로만 필터를 만들므로 활성화 여부는 확인하지 않습니다.
+        필터를 단독으로 사용할 때는 ``apply_checked``를 사용합니다.
+        """
         pass
 
+    def apply_checked(self, tags: List[str]) -> List[str]:
+        """필터가 활성화되어 있을 때만 태그 목록에 적용"""
+        return self.apply(tags) if self.rule.enabled else tags
+
     @abstractmethod
     def matches(self, tag: str) -> bool:
         """개별 태그가 필터 조건에 맞는지 확인"""
@@ -128,16 +149,29 @@ class BaseFilter(ABC):
 
 
 class BaseGroupFilter(ABC):
-    """기본 그룹 필터 추상 클래스"""
+    """기본 그룹 필터 추상 클래스
+
+    ``BaseFilter``와 마찬가지로 하위 클래스도 ``__slots__``를 선언해야 합니다.
+    """
+
+    __slots__ = ('kind', 'rule')
 
     def __init__(self, rule: GroupFilterRule):
         self.rule = rule
+        self.kind = FILTER_KINDS[rule.filter_type]
 
     @abstractmethod
     def apply(self, tags: List[str]) -> List[str]:
-        """태그 목록에 그룹 필터를 적용"""
+        """태그 목록에 그룹 필터를 적용
+
+        ``BaseFilter.apply``와 마찬가지로 활성화 여부는 확인하지 않습니다.
+        """
         pass
 
+    def apply_checked(self, tags: List[str]) -> List[str]:
+        """필터가 활성화되어 있을 때만 태그 목록에 적용"""
+        return self.apply(tags) if self.rule.enabled else tags
+
     @abstractmethod
     def matches(self, tags: List[str]) -> bool:
         """태그 목록이 그룹 조건에 맞는지 확인"""
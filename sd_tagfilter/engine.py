@@ -3,14 +3,44 @@
 우선순위에 따라 필터링 규칙을 순차 적용하는 엔진을 제공합니다.
 """
 
+import logging
 import time
-from collections.abc import Generator
-from typing import List, Sequence
+from bisect import insort_right
+from collections.abc import Callable, Generator, Iterable
+from itertools import chain, compress, islice
+from typing import List, NamedTuple, Sequence, cast
 
 from pydantic import BaseModel
 
-from .base import AnyFilter, AnyFilterRule, BaseFilter, FilterRule
-from .filters import FilterFactory, ReplaceCaptureFilter, ReplaceFilter
+from .base import FILTER_KINDS, AnyFilter, AnyFilterRule, BaseFilter, FilterType
+from .filters import (
+    FilterFactory,
+    MultiPatternFilter,
+    MultiReplaceFilter,
+    PlainKeywordFilter,
+    RegexFilter,
+    ReplaceCaptureFilter,
+    ReplaceFilter,
+    WildcardFilter,
+    compile_pipeline,
+)
+
+logger = logging.getLogger(__name__)
+
+# 파이프라인의 적용 단계 (개별 필터 또는 합쳐진 필터)
+AnyStage = AnyFilter | MultiPatternFilter | MultiReplaceFilter
+
+_REPLACE_KINDS = frozenset((FILTER_KINDS[FilterType.REPLACE], FILTER_KINDS[FilterType.REPLACE_CAPTURE]))
+
+# 태그마다 독립적으로 판정하는 단계 타입 (여러 목록을 합쳐 한 번에 처리해도 결과가 같음)
+# 정확한 타입으로만 판별하며, 교체 단계는 입력과 같은 길이의 목록을 돌려줌
+_REMOVING_STAGES = frozenset((MultiPatternFilter, PlainKeywordFilter, WildcardFilter, RegexFilter))
+_REPLACING_STAGES = frozenset((MultiReplaceFilter, ReplaceFilter, ReplaceCaptureFilter))
+
+
+def _descending_priority(filter_instance: AnyFilter) -> int:
+    """높은 우선순위가 앞에 오도록 하는 정렬 키"""
+    return -filter_instance.get_priority()
 
 
 class TagFilterEngine:
@@ -31,7 +61,12 @@ class TagFilterEngine:
         self._sort_filters_by_priority()
 
     def _create_filters(self, rules: Sequence[AnyFilterRule]) -> List[AnyFilter]:
-        """규칙들로부터 필터 인스턴스들을 생성"""
+        """규칙들로부터 필터 인스턴스들을 생성
+
+        필터는 생성 시점에 정규식과 그룹 패턴을 모두 컴파일하므로,
+        패턴 컴파일은 엔진 생성 단계에서 끝나고 ``filter_tags``에서는 일어나지 않습니다.
+        ``add_rule``/``remove_rule``도 해당 필터만 만들거나 빼고 적용 단계를 한 번 다시 구성합니다.
+        """
         filters: list[AnyFilter] = []
         for rule in rules:
             if rule.enabled:
@@ -40,12 +75,69 @@ class TagFilterEngine:
                     filters.append(filter_instance)
                 except ValueError as e:
                     # 알 수 없는 필터 타입은 무시하고 계속 진행
-                    print(f'Warning: {e}')
+                    logger.warning('%s', e)
         return filters
 
     def _sort_filters_by_priority(self):
         """필터들을 우선순위에 따라 정렬 (높은 우선순위부터)"""
-        self.filters.sort(key=lambda f: f.get_priority(), reverse=True)
+        self.filters.sort(key=_descending_priority)
+        self._rebuild_stages()
+
+    def _rebuild_stages(self):
+        """정렬된 필터 목록으로부터 적용 단계와 열 데이터를 다시 구성"""
+        self._pipeline = self._build_pipeline(self.filters)
+        # 활성화된 단계만 일렬로 호출하는 함수를 생성해 두어 호출마다 활성화 여부와 속성을 확인하지 않도록 함
+        self._run_pipeline = compile_pipeline([stage for stage in self._pipeline if stage.is_enabled()])
+
+        # 개별 태그 판정용 열(column) 데이터
+        # 태그를 제거하는 단계의 바운드 matches만 미리 골라 두어 태그마다 필터 종류를 확인하지 않도록 함
+        # 합쳐진 단계는 하나의 matches로 묶인 필터들을 한 번에 판정하며, 그룹 필터와 교체 필터는 제외
+        self._removal_matchers: tuple[Callable[[str], bool], ...] = tuple(
+            stage.matches
+            for stage in self._pipeline
+            if stage.is_enabled()
+            and (
+                isinstance(stage, MultiPatternFilter)
+                or (isinstance(stage, BaseFilter) and stage.kind not in _REPLACE_KINDS)
+            )
+        )
+
+    def _build_pipeline(self, filters: Sequence[AnyFilter]) -> List[AnyStage]:
+        """정렬된 필터들로부터 실제 적용 단계를 구성
+
+        우선순위상 연속된 제거 전용 필터들은 순서를 바꿔도 결과가 같으므로
+        하나의 ``MultiPatternFilter``로 합쳐 태그당 한 번의 스캔으로 처리합니다.
+        연속된 교체 필터들은 하나의 ``MultiReplaceFilter``로 합쳐 태그당 한 번의 사전 조회로 처리합니다.
+        """
+        pipeline: List[AnyStage] = []
+        run: List[BaseFilter] = []
+        run_type: type[MultiPatternFilter | MultiReplaceFilter] | None = None
+
+        def flush_run():
+            if len(run) == 1:
+                pipeline.append(run[0])
+            elif run_type is MultiPatternFilter:
+                pipeline.append(MultiPatternFilter(run))
+            elif run_type is MultiReplaceFilter:
+                pipeline.append(MultiReplaceFilter(cast(List[ReplaceFilter], run)))
+            run.clear()
+
+        for filter_instance in filters:
+            fuser = None
+            if isinstance(filter_instance, BaseFilter):
+                if MultiPatternFilter.can_fuse(filter_instance):
+                    fuser = MultiPatternFilter
+                elif MultiReplaceFilter.can_fuse(filter_instance):
+                    fuser = MultiReplaceFilter
+            if fuser is not run_type:
+                flush_run()
+                run_type = fuser
+            if fuser is not None and isinstance(filter_instance, BaseFilter):
+                run.append(filter_instance)
+            else:
+                pipeline.append(filter_instance)
+        flush_run()
+        return pipeline
 
     def filter_tags(self, tags: List[str]) -> List[str]:
         """태그 목록에 모든 필터를 순차적으로 적용
@@ -59,17 +151,63 @@ class TagFilterEngine:
         if not tags:
             return tags
 
-        current_tags = tags.copy()
+        # 각 단계는 입력 목록을 수정하지 않고 새 목록을 만들거나 입력을 그대로 돌려주므로 미리 복사하지 않음
+        result = self._run_pipeline(tags)
+        # 모든 단계가 입력을 그대로 돌려준 경우에만 호출자의 목록과 분리되도록 복사
+        return tags.copy() if result is tags else result
 
-        # 우선순위에 따라 필터를 순차 적용
-        for filter_instance in self.filters:
-            if filter_instance.is_enabled():
-                current_tags = filter_instance.apply(current_tags)
-                # 태그가 모두 제거되면 조기 종료
-                if not current_tags:
-                    break
+    def filter_tags_many(self, tag_batches: Sequence[List[str]]) -> List[List[str]]:
+        """여러 태그 목록을 한 번에 필터링
 
-        return current_tags
+        ``[self.filter_tags(tags) for tags in tag_batches]``와 같은 결과를 돌려줍니다.
+        태그별로 판정하는 연속된 단계들은 모든 목록의 고유 태그에 대해 한 번만 실행한 뒤
+        결과를 각 목록에 나눠 담으므로, 데이터셋처럼 목록 간에 태그가 많이 겹칠수록 빠릅니다.
+        그룹 필터처럼 목록 전체를 봐야 하는 단계는 목록별로 적용합니다.
+
+        Args:
+            tag_batches: 필터링할 태그 목록들
+
+        Returns:
+            목록별로 필터링된 태그 목록들
+        """
+        batches = [list(tags) for tags in tag_batches]
+        segment: List[AnyStage] = []
+        for stage in self._pipeline:
+            if not stage.is_enabled():
+                continue
+            stage_type = type(stage)
+            if stage_type in _REMOVING_STAGES or stage_type in _REPLACING_STAGES:
+                segment.append(stage)
+                continue
+            if segment:
+                batches = self._apply_per_tag_segment(segment, batches)
+                segment = []
+            batches = [stage.apply(tags) if tags else tags for tags in batches]
+        if segment:
+            batches = self._apply_per_tag_segment(segment, batches)
+        return batches
+
+    def _apply_per_tag_segment(self, stages: Sequence[AnyStage], batches: List[List[str]]) -> List[List[str]]:
+        """태그별 판정 단계들을 고유 태그에 한 번만 적용하고 각 목록에 결과를 나눠 담음"""
+        origins = list(dict.fromkeys(chain.from_iterable(batches)))
+        current = origins
+        for stage in stages:
+            if not current:
+                break
+            if type(stage) in _REPLACING_STAGES:
+                current = stage.apply(current)
+            elif current is origins:
+                # 아직 교체된 태그가 없으면 남은 태그가 곧 원본 태그
+                current = origins = stage.apply(current)
+            else:
+                # 제거 여부는 태그 값에만 달려 있으므로 남은 값 집합으로 원본 쪽도 걸러냄
+                kept = set(stage.apply(current))
+                mask = [tag in kept for tag in current]
+                origins = list(compress(origins, mask))
+                current = list(compress(current, mask))
+
+        get_result = dict(zip(origins, current)).get
+        return [[result for tag in tags if (result := get_result(tag)) is not None] for tags in batches]
 
     def get_filter_count(self) -> int:
         """활성화된 필터 개수 반환"""
@@ -84,32 +222,48 @@ class TagFilterEngine:
         if rule.enabled:
             try:
                 filter_instance = FilterFactory.create_filter(rule)
-                self.filters.append(filter_instance)
-                self._sort_filters_by_priority()
+                # 이미 정렬된 목록이므로 전체를 다시 정렬하지 않고 같은 우선순위의 뒤에 삽입
+                insort_right(self.filters, filter_instance, key=_descending_priority)
+                self._rebuild_stages()
                 self.rules.append(rule)
             except ValueError as e:
-                print(f'Warning: Failed to add rule: {e}')
+                logger.warning('Failed to add rule: %s', e)
 
     def remove_rule(self, rule: AnyFilterRule):
         """규칙 제거"""
         if rule in self.rules:
             self.rules.remove(rule)
-            # 필터도 다시 생성
-            self.filters = self._create_filters(self.rules)
-            self._sort_filters_by_priority()
+            # 필터를 모두 다시 만들지 않고 해당 규칙의 필터만 제거 (남은 순서는 그대로 정렬 상태)
+            for index, filter_instance in enumerate(self.filters):
+                if filter_instance.rule == rule:
+                    del self.filters[index]
+                    self._rebuild_stages()
+                    break
 
     def clear_rules(self):
         """모든 규칙 제거"""
         self.rules.clear()
         self.filters.clear()
+        self._rebuild_stages()
 
 
 class Stats(BaseModel):
     total_processed: int = 0
     total_filtered: int = 0
     processing_time: float = 0.0
-    filter_rate: float = 0.0
-    avg_processing_time: float = 0.0
+
+
+class PerformanceStats(NamedTuple):
+    """성능 통계 스냅샷
+
+    ``get_performance_stats``가 돌려주는 불변 값으로, 누적 중인 ``Stats`` 모델을 복사하지 않고 만듭니다.
+    """
+
+    total_processed: int
+    total_filtered: int
+    processing_time: float
+    filter_rate: float
+    avg_processing_time: float
 
 
 class OptimizedTagFilterEngine(TagFilterEngine):
@@ -129,25 +283,14 @@ class OptimizedTagFilterEngine(TagFilterEngine):
         """
         super().__init__(rules)
         self.batch_size = batch_size
-        self._precompile_patterns()
         self.stats: Stats = Stats()
 
-    def _precompile_patterns(self):
-        """모든 패턴을 미리 컴파일하여 성능 향상"""
-        from .patterns import pattern_cache
-
-        for rule in self.rules:
-            if isinstance(rule, FilterRule):
-                # 정규식 패턴들을 미리 컴파일
-                try:
-                    pattern_cache.get_compiled_pattern(rule.pattern)
-                except Exception:
-                    # 컴파일 실패는 무시 (런타임에서 처리)
-                    pass
-            # TODO: elif isinstance(rule,GroupFilterRule):
-
     def filter_tags(self, tags: List[str]) -> List[str]:
-        """성능 측정과 함께 태그 필터링"""
+        """성능 측정과 함께 태그 필터링
+
+        입력 태그는 인턴하지 않습니다. 인턴된 문자열은 해제되지 않아 고유 태그가 많은 대용량 처리에서
+        메모리가 계속 늘어나므로, 개수가 정해진 규칙 쪽 문자열(교체 결과, 키워드)만 인턴합니다.
+        """
         start_time = time.perf_counter()
         original_count = len(tags)
 
@@ -164,48 +307,62 @@ class OptimizedTagFilterEngine(TagFilterEngine):
     def filter_tags_batch(self, tag_batches: List[List[str]]) -> List[List[str]]:
         """배치 단위로 태그 필터링
 
+        배치 간에 겹치는 태그를 한 번만 판정하는 ``filter_tags_many``로 처리합니다.
+        표준 ``re``는 매칭 중에 GIL을 놓지 않으므로 배치를 스레드 풀로 나누지 않습니다.
+
         Args:
             tag_batches: 태그 배치 목록
 
         Returns:
             필터링된 태그 배치 목록
         """
-        return [self.filter_tags(batch) for batch in tag_batches]
+        return self.filter_tags_many(tag_batches)
+
+    def filter_tags_many(self, tag_batches: Sequence[List[str]]) -> List[List[str]]:
+        """성능 측정과 함께 여러 태그 목록을 한 번에 필터링"""
+        start_time = time.perf_counter()
+        original_count = sum(map(len, tag_batches))
+
+        results = super().filter_tags_many(tag_batches)
+
+        # 통계 업데이트
+        end_time = time.perf_counter()
+        self.stats.total_processed += original_count
+        self.stats.total_filtered += original_count - sum(map(len, results))
+        self.stats.processing_time += end_time - start_time
+
+        return results
 
-    def filter_tags_stream(self, tags: Generator[str, None, None]) -> Generator[str, None, None]:
+    def filter_tags_stream(self, tags: Iterable[str]) -> Generator[str, None, None]:
         """스트리밍 방식으로 태그 필터링
 
         Args:
-            tags: 태그 제너레이터
+            tags: 태그를 차례로 내놓는 이터러블 (제너레이터 등)
 
         Yields:
             필터링된 태그들
         """
-        batch: List[str] = []
-        for tag in tags:
-            batch.append(tag)
-            if len(batch) >= self.batch_size:
-                filtered_batch = self.filter_tags(batch)
-                for filtered_tag in filtered_batch:
-                    yield filtered_tag
-                batch = []
-
-        # 남은 태그들 처리
-        if batch:
-            filtered_batch = self.filter_tags(batch)
-            for filtered_tag in filtered_batch:
-                yield filtered_tag
-
-    def get_performance_stats(self) -> Stats:
-        """성능 통계 반환"""
-        stats = self.stats.model_copy()
-        if stats.total_processed > 0:
-            stats.filter_rate = stats.total_filtered / stats.total_processed
-            stats.avg_processing_time = stats.processing_time / stats.total_processed
+        # 배치는 islice로 C 레벨에서 잘라 내고, 결과는 yield from으로 그대로 넘김
+        iterator = iter(tags)
+        while batch := list(islice(iterator, self.batch_size)):
+            yield from self.filter_tags(batch)
+
+    def get_performance_stats(self) -> PerformanceStats:
+        """성능 통계 반환
+
+        자주 조회해도 Pydantic 모델을 복사하지 않도록 누적 값으로 스냅샷만 만듭니다.
+        """
+        stats = self.stats
+        total_processed = stats.total_processed
+        if total_processed > 0:
+            filter_rate = stats.total_filtered / total_processed
+            avg_processing_time = stats.processing_time / total_processed
         else:
-            stats.filter_rate = 0.0
-            stats.avg_processing_time = 0.0
-        return stats
+            filter_rate = 0.0
+            avg_processing_time = 0.0
+        return PerformanceStats(
+            total_processed, stats.total_filtered, stats.processing_time, filter_rate, avg_processing_time
+        )
 
     def reset_stats(self):
         """통계 초기화"""
@@ -215,11 +372,11 @@ class OptimizedTagFilterEngine(TagFilterEngine):
 class MemoryEfficientFilterEngine(TagFilterEngine):
     """메모리 효율적인 스트리밍 필터링 엔진"""
 
-    def filter_tags_stream(self, tags: Generator[str, None, None]) -> Generator[str, None, None]:
+    def filter_tags_stream(self, tags: Iterable[str]) -> Generator[str, None, None]:
         """스트리밍 방식으로 태그 필터링 (메모리 효율적)
 
         Args:
-            tags: 태그 제너레이터
+            tags: 태그를 차례로 내놓는 이터러블 (제너레이터 등)
 
         Yields:
             필터링된 태그들
@@ -237,16 +394,11 @@ class MemoryEfficientFilterEngine(TagFilterEngine):
         Returns:
             태그를 유지해야 하면 True
         """
-        # 그룹 필터는 개별 태그로는 판단할 수 없으므로 제외
-        for filter_instance in self.filters:
-            if not filter_instance.is_enabled():
-                continue
-            # 그룹 필터가 아닌 경우에만 개별 태그 매칭 확인
-            if isinstance(filter_instance, BaseFilter):
-                if filter_instance.matches(tag):
-                    # 교체 필터인 경우는 제거하지 않음
-                    if isinstance(filter_instance, (ReplaceFilter, ReplaceCaptureFilter)):
-                        return False
+        # 그룹 필터는 개별 태그로는 판단할 수 없고 교체 필터는 태그를 제거하지 않으므로
+        # 열 데이터에서 이미 제외됨
+        for matches in self._removal_matchers:
+            if matches(tag):
+                return False
         return True
 
 
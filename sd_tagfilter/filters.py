@@ -3,27 +3,58 @@
 다양한 필터링 방식을 구현한 클래스들을 제공합니다.
 """
 
-from typing import List
+import hashlib
+import linecache
+import sys
+import weakref
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from itertools import filterfalse
+from operator import methodcaller
+from typing import Any, List, Optional, Sequence
 
 from .base import (
+    FILTER_KINDS,
     AnyFilter,
     AnyFilterRule,
     BaseFilter,
     BaseGroupFilter,
     FilterRule,
     FilterType,
+    GroupFilterRule,
 )
 from .patterns import (
-    match_with_wildcards,
+    JOINED_SCAN_MIN_TAGS,
+    build_keyword_automaton,
+    build_keyword_pattern,
+    build_union_pattern,
+    compile_joined_scanner,
+    compile_search_pattern,
+    compile_substitution,
+    compile_wildcard_matcher,
+    filter_joined,
+    is_fusable_regex,
+    is_re2_enabled,
+    literal_wildcard_shape,
     parse_replacement_pattern,
-    pattern_cache,
-    substitute_with_capture,
     wildcard_to_regex,
 )
 
+_PLAIN_KEYWORD_KIND = FILTER_KINDS[FilterType.PLAIN_KEYWORD]
+_WILDCARD_KIND = FILTER_KINDS[FilterType.WILDCARD]
+
+# 생성된 파이프라인 함수의 단계 종류
+_CALL_STEP = 'call'
+_REPLACE_STEP = 'replace'
+
 
 def normalize_tag(tag: str) -> str:
-    """태그를 정규화"""
+    """태그를 정규화
+
+    ``strip``과 ``replace``는 바꿀 것이 없으면 원본 문자열을 그대로 돌려주므로,
+    이미 정리된 태그는 ``lower``에서만 새 문자열이 만들어집니다.
+    ``str.translate``는 문자별 매핑 조회로 ``replace``보다 10배 이상 느려 사용하지 않습니다.
+    """
     return tag.strip().lower().replace(' ', '_')
 
 
@@ -34,40 +65,58 @@ class PlainKeywordFilter(BaseFilter):
     ComfyUI-LogicUtils의 FilterTagsNode와 유사한 기능입니다.
     """
 
+    __slots__ = ('_keyword',)
+
+    def __init__(self, rule: FilterRule):
+        super().__init__(rule)
+        # 태그마다 호출되는 matches에서 규칙 튜플의 필드를 다시 꺼내지 않도록 보관
+        self._keyword = sys.intern(rule.pattern)
+
     def apply(self, tags: List[str]) -> List[str]:
         """태그 목록에서 키워드가 포함된 태그들을 제거"""
-        if not self.is_enabled():
-            return tags
-
-        return [tag for tag in tags if not self.matches(tag)]
+        # 태그별 matches 호출 없이 정규화와 포함 검사를 한 번에 수행
+        keyword = self._keyword
+        return [tag for tag in tags if keyword not in normalize_tag(tag)]
 
     def matches(self, tag: str) -> bool:
         """태그에 키워드가 포함되어 있는지 확인"""
-        normalized_tag = normalize_tag(tag)
-
-        return self.rule.pattern in normalized_tag
+        return self._keyword in normalize_tag(tag)
 
 
 class WildcardFilter(BaseFilter):
     """와일드카드 필터
 
     와일드카드 패턴(*, _, ?)을 사용한 태그 필터링을 제공합니다.
+    패턴은 필터 생성 시 한 번만 정규식으로 변환/컴파일하며, 엔진에서는 인접한 와일드카드 규칙들을
+    ``MultiPatternFilter``가 하나의 교대 패턴으로 합칩니다.
     """
 
+    __slots__ = ('_match', '_regex_pattern')
+
     def __init__(self, rule: FilterRule):
         super().__init__(rule)
         self._regex_pattern = wildcard_to_regex(rule.pattern)
+        self._compiled_pattern = compile_search_pattern(self._regex_pattern)
+        self._match = self._build_matcher(rule.pattern)
+
+    def _build_matcher(self, pattern: str) -> Callable[[str], object]:
+        """패턴 모양에 맞는 매칭 함수 선택
+
+        ``*X``, ``X*``, ``*X*``, ``X`` 형태의 리터럴 패턴은 정규식 엔진 없이
+        ``str`` 메서드로 판정하고, 그 외의 패턴만 컴파일된 정규식을 사용합니다.
+        """
+        if literal_wildcard_shape(pattern) is None:
+            # RE2 설정을 따르도록 검색용으로 컴파일한 정규식을 사용
+            return self._compiled_pattern.fullmatch
+        return compile_wildcard_matcher(pattern)
 
     def apply(self, tags: List[str]) -> List[str]:
         """태그 목록에서 와일드카드 패턴에 매칭되는 태그들을 제거"""
-        if not self.is_enabled():
-            return tags
-
-        return [tag for tag in tags if not self.matches(tag)]
+        return list(filterfalse(self._match, tags))
 
     def matches(self, tag: str) -> bool:
         """태그가 와일드카드 패턴에 매칭되는지 확인"""
-        return match_with_wildcards(tag, self.rule.pattern)
+        return bool(self._match(tag))
 
 
 class RegexFilter(BaseFilter):
@@ -76,16 +125,19 @@ class RegexFilter(BaseFilter):
     정규 표현식을 사용한 고급 태그 필터링을 제공합니다.
     """
 
+    __slots__ = ('_joined_scanner',)
+
     def __init__(self, rule: FilterRule):
         super().__init__(rule)
-        self._compiled_pattern = pattern_cache.get_compiled_pattern(rule.pattern)
+        self._compiled_pattern = compile_search_pattern(rule.pattern)
+        self._joined_scanner = compile_joined_scanner([rule.pattern])
 
     def apply(self, tags: List[str]) -> List[str]:
         """태그 목록에서 정규식에 매칭되는 태그들을 제거"""
-        if not self.is_enabled():
-            return tags
-
-        return [tag for tag in tags if not self.matches(tag)]
+        if self._joined_scanner is not None and len(tags) >= JOINED_SCAN_MIN_TAGS:
+            return filter_joined(self._joined_scanner, self._compiled_pattern.search, tags)
+        # 컴파일된 패턴의 search를 직접 넘겨 태그별 파이썬 호출 없이 C 레벨에서 걸러냄
+        return list(filterfalse(self._compiled_pattern.search, tags))
 
     def matches(self, tag: str) -> bool:
         """태그가 정규식 패턴에 매칭되는지 확인"""
@@ -99,44 +151,78 @@ class GroupFilter(BaseGroupFilter):
     예: steam, sweat, blush가 모두 있으면 세 태그 모두 제거
     """
 
+    __slots__ = ('_joinable', '_pattern_automaton', '_pattern_search', '_pattern_set', '_patterns')
+
+    def __init__(self, rule: GroupFilterRule):
+        super().__init__(rule)
+        # 중복 패턴은 결과에 영향이 없으므로 순서를 유지한 채 한 번씩만 확인
+        self._patterns = tuple(dict.fromkeys(rule.patterns))
+        self._pattern_set = frozenset(self._patterns)
+        # 패턴이 많고 pyahocorasick이 있으면 오토마톤 한 번의 순회로 포함된 패턴을 모두 찾음
+        self._pattern_automaton = build_keyword_automaton(self._patterns)
+        keyword_pattern = build_keyword_pattern(self._patterns) if self._pattern_automaton is None else None
+        self._pattern_search = keyword_pattern.search if keyword_pattern is not None else None
+        # 줄바꿈이 든 패턴은 이어 붙인 태그의 경계를 넘어 매칭될 수 있으므로 태그별로 확인
+        self._joinable = not any('\n' in pattern for pattern in self._patterns)
+
     def apply(self, tags: List[str]) -> List[str]:
         """태그 목록에서 그룹 조건에 맞는 태그들을 제거"""
-        if not self.is_enabled():
+        if self._pattern_automaton is not None:
+            return self._apply_automaton(tags, self._pattern_automaton)
+
+        search = self._pattern_search
+        if search is None:
             return tags
 
-        if not self.matches(tags):
+        # 태그마다 한 번씩만 검색하여 남길 태그와 패턴이 포함된 태그를 함께 분류
+        kept_tags: List[str] = []
+        matched_tags: List[str] = []
+        for tag in tags:
+            normalized_tag = normalize_tag(tag)
+            if search(normalized_tag):
+                matched_tags.append(normalized_tag)
+            else:
+                kept_tags.append(tag)
+
+        # 패턴은 검색에 걸린 태그에만 나타날 수 있으므로 그룹 판정도 그 태그들만 확인
+        if not matched_tags or not self._matches_normalized(matched_tags):
             return tags
+        return kept_tags
 
-        # 그룹의 모든 패턴에 매칭되는 태그들을 제거
-        filtered_tags: List[str] = []
+    def _apply_automaton(self, tags: List[str], automaton: Callable[[str], Iterator[object]]) -> List[str]:
+        """오토마톤으로 패턴이 포함된 태그를 찾아 그룹 조건에 맞으면 제거"""
+        kept_tags: List[str] = []
+        matched_tags: List[str] = []
         for tag in tags:
-            should_remove = False
-            for pattern in self.rule.patterns:
-                if self._matches_pattern(tag, pattern):
-                    should_remove = True
-                    break
-            if not should_remove:
-                filtered_tags.append(tag)
+            normalized_tag = normalize_tag(tag)
+            # 첫 출현만 확인하면 되므로 이터레이터를 끝까지 돌지 않음
+            if next(automaton(normalized_tag), None) is None:
+                kept_tags.append(tag)
+            else:
+                matched_tags.append(normalized_tag)
 
-        return filtered_tags
+        if not matched_tags or not self._matches_normalized(matched_tags):
+            return tags
+        return kept_tags
 
     def matches(self, tags: List[str]) -> bool:
         """태그 목록이 그룹 조건에 맞는지 확인"""
-        # 모든 패턴이 태그 목록에 존재하는지 확인
-        for pattern in self.rule.patterns:
-            pattern_found = False
-            for tag in tags:
-                if self._matches_pattern(tag, pattern):
-                    pattern_found = True
-                    break
-            if not pattern_found:
-                return False
-        return True
-
-    def _matches_pattern(self, tag: str, pattern: str) -> bool:
-        """태그가 패턴에 매칭되는지 확인 (플레인 키워드 매칭)"""
-        normalized_tag = normalize_tag(tag)
-        return pattern in normalized_tag
+        return self._matches_normalized(list(map(normalize_tag, tags)))
+
+    def _matches_normalized(self, normalized_tags: List[str]) -> bool:
+        """정규화된 태그 목록이 그룹 조건에 맞는지 확인"""
+        # 정규화된 태그와 정확히 같은 패턴은 집합 연산 한 번으로 확인하고,
+        # 남은 패턴만 부분 문자열 매칭으로 확인
+        missing_patterns = self._pattern_set.difference(normalized_tags)
+        if not missing_patterns:
+            return True
+        if not normalized_tags:
+            return False
+        if self._joinable:
+            # 이어 붙인 문자열에서 패턴마다 한 번씩 C 레벨로 검색
+            joined = '\n'.join(normalized_tags)
+            return all(pattern in joined for pattern in missing_patterns)
+        return all(any(pattern in normalized_tag for normalized_tag in normalized_tags) for pattern in missing_patterns)
 
 
 class ReplaceFilter(BaseFilter):
@@ -146,27 +232,29 @@ class ReplaceFilter(BaseFilter):
     패턴 형식: "original_tag||replacement_tag"
     """
 
+    __slots__ = ('original_pattern', 'replacement')
+
     def __init__(self, rule: FilterRule):
         super().__init__(rule)
-        self.original_pattern, self.replacement = parse_replacement_pattern(rule.pattern)
+        original_pattern, replacement = parse_replacement_pattern(rule.pattern)
+        # 인턴된 태그와는 동일 객체 비교로 바로 일치 판정되고, 교체된 태그들은 하나의 문자열을 공유함
+        self.original_pattern = sys.intern(original_pattern)
+        self.replacement = sys.intern(replacement)
 
     def apply(self, tags: List[str]) -> List[str]:
         """태그 목록에서 매칭되는 태그들을 교체"""
-        if not self.is_enabled():
-            return tags
-
-        result: List[str] = []
-        for tag in tags:
-            if self.matches(tag):
-                result.append(self.replacement)
-            else:
-                result.append(tag)
-        return result
+        original_pattern = self.original_pattern
+        replacement = self.replacement
+        return [replacement if tag == original_pattern else tag for tag in tags]
 
     def matches(self, tag: str) -> bool:
         """태그가 교체 대상인지 확인"""
         return tag == self.original_pattern
 
+    def pipeline_step(self) -> tuple[str, Callable[..., Any]]:
+        """생성된 파이프라인에서 사전 조회 한 번으로 인라인되도록 교체 단계로 표현"""
+        return _REPLACE_STEP, {self.original_pattern: self.replacement}.get
+
 
 class ReplaceCaptureFilter(BaseFilter):
     """캡처를 이용한 교체 필터
@@ -175,32 +263,416 @@ class ReplaceCaptureFilter(BaseFilter):
     패턴 형식: "(.*)_hair||$1_bald"
     """
 
+    __slots__ = ('_sub_replacement', 'original_pattern', 'replacement')
+
     def __init__(self, rule: FilterRule):
         super().__init__(rule)
         self.original_pattern, self.replacement = parse_replacement_pattern(rule.pattern)
-        self._compiled_pattern = pattern_cache.get_compiled_pattern(self.original_pattern)
+        # $1 -> \g<1> 변환은 규칙 생성 시 한 번만 수행
+        self._compiled_pattern, self._sub_replacement = compile_substitution(self.original_pattern, self.replacement)
 
     def apply(self, tags: List[str]) -> List[str]:
         """태그 목록에서 매칭되는 태그들을 캡처 그룹을 이용해 교체"""
-        if not self.is_enabled():
-            return tags
-
-        result: List[str] = []
-        for tag in tags:
-            if self.matches(tag):
-                replaced = substitute_with_capture(tag, self.original_pattern, self.replacement)
-                result.append(replaced)
-            else:
-                result.append(tag)
-        return result
+        # 매칭된 태그만 치환하여, 치환 문자열 오류는 이전처럼 매칭될 때만 발생
+        search = self._compiled_pattern.search
+        sub = self._compiled_pattern.sub
+        replacement = self._sub_replacement
+        return [sub(replacement, tag) if search(tag) else tag for tag in tags]
 
     def matches(self, tag: str) -> bool:
         """태그가 정규식 패턴에 매칭되는지 확인"""
         return bool(self._compiled_pattern.search(tag))
 
 
+# 생성 코드로 판정할 최대 필터 수 (많으면 교대 정규식/접두사 트리가 더 빠름)
+_GENERATED_MAX_FILTERS = 8
+
+# 접미사 와일드카드(*X)를 endswith 튜플로 판정할 최소 패턴 수
+# ^.*X$ 분기는 태그마다 끝까지 되짚어 보므로 패턴 수에 비례해 느려지지만, endswith는 거의 일정함
+_SUFFIX_TUPLE_MIN_PATTERNS = 2
+
+_LITERAL_CONDITIONS = {
+    '__contains__': '{literal!r} in tag',
+    'endswith': 'tag.endswith({literal!r})',
+    'startswith': 'tag.startswith({literal!r})',
+    '__eq__': 'tag == {literal!r}',
+}
+
+
+@lru_cache(maxsize=256)
+def _generate_literal_filter(
+    shapes: tuple[tuple[str, str], ...], keywords: tuple[str, ...]
+) -> Callable[[List[str]], List[str]]:
+    """리터럴 조건들을 하나의 리스트 컴프리헨션으로 인라인한 제거 함수 생성
+
+    규칙 집합은 엔진이 살아 있는 동안 바뀌지 않으므로, 조건마다 함수를 호출하는 대신
+    모든 비교를 인라인한 코드를 한 번 생성합니다. 생성된 소스는 ``linecache``에 등록되어
+    트레이스백과 ``inspect.getsource``로 확인할 수 있습니다.
+
+    Args:
+        shapes: ``literal_wildcard_shape``로 분해한 와일드카드 조건들
+        keywords: 정규화된 태그에서 찾을 플레인 키워드들
+
+    Returns:
+        태그 목록에서 조건 중 하나라도 맞는 태그를 제거하는 함수
+    """
+    conditions = [_LITERAL_CONDITIONS[method].format(literal=literal) for method, literal in shapes]
+    if keywords:
+        # 정규화(normalize_tag와 같은 변환)는 태그당 한 번만 수행
+        first, *rest = keywords
+        conditions.append(f"{first!r} in (normalized := tag.strip().lower().replace(' ', '_'))")
+        conditions.extend(f'{keyword!r} in normalized' for keyword in rest)
+
+    body = '\n            or '.join(conditions)
+    source = f'def generated_filter(tags):\n    return [tag for tag in tags if not (\n            {body}\n    )]\n'
+    return _exec_generated(source, 'generated_filter')
+
+
+def _exec_generated(source: str, name: str) -> Any:
+    """생성한 소스를 실행하여 정의된 함수를 반환
+
+    소스는 ``linecache``에 등록되어 트레이스백과 ``inspect.getsource``로 확인할 수 있으며,
+    반환한 함수가 해제되면 등록도 제거됩니다.
+    """
+    filename = f'<sd_tagfilter generated {hashlib.sha1(source.encode()).hexdigest()[:12]}>'
+
+    namespace: dict[str, Any] = {}
+    exec(compile(source, filename, 'exec'), namespace)
+    entry = (len(source), None, source.splitlines(keepends=True), filename)
+    linecache.cache[filename] = entry
+    function = namespace[name]
+    # lru_cache에서 밀려난 함수를 아무도 참조하지 않게 되면 등록한 소스도 함께 제거
+    weakref.finalize(function, _forget_generated_source, filename, entry)
+    return function
+
+
+def _forget_generated_source(filename: str, entry: tuple[Any, ...]) -> None:
+    """``_exec_generated``가 등록한 소스를 ``linecache``에서 제거 (같은 소스로 다시 등록된 경우는 유지)"""
+    if linecache.cache.get(filename) is entry:
+        del linecache.cache[filename]
+
+
+class MultiPatternFilter:
+    """다중 패턴 제거 필터
+
+    우선순위상 연속된 제거 전용 필터(플레인 키워드, 와일드카드, 정규식)를 하나로 합칩니다.
+    플레인 키워드는 정규화된 태그에 대한 하나의 교대 패턴(키워드가 많으면 접두사 트리,
+    pyahocorasick이 설치되어 있으면 Aho-Corasick 오토마톤)으로,
+    와일드카드와 정규식은 원본 태그에 대한 하나의 교대 패턴으로 컴파일되어
+    태그당 규칙 수와 무관하게 최대 두 번의 스캔으로 제거 여부를 판정합니다.
+    """
+
+    __slots__ = (
+        '_exact_tags',
+        '_fallback',
+        '_generated',
+        '_joined_scanner',
+        '_keyword_automaton',
+        '_keyword_pattern',
+        '_suffix_match',
+        '_union_pattern',
+        'filters',
+    )
+
+    fusable_types = (PlainKeywordFilter, WildcardFilter, RegexFilter)
+
+    def __init__(self, filters: Sequence[BaseFilter]):
+        self.filters = list(filters)
+
+        keywords: List[str] = []
+        exact_tags: List[str] = []
+        suffixes: List[str] = []
+        suffix_regexes: List[str] = []
+        regexes: List[str] = []
+        regex_filters: List[BaseFilter] = []
+        suffix_filters: List[BaseFilter] = []
+        fallback: List[BaseFilter] = []
+        for filter_instance in self.filters:
+            kind = filter_instance.kind
+            if kind == _PLAIN_KEYWORD_KIND:
+                keywords.append(filter_instance.rule.pattern)
+            elif kind == _WILDCARD_KIND:
+                shape = literal_wildcard_shape(filter_instance.rule.pattern)
+                # 교대 패턴은 search로 판정하므로 태그 전체 일치를 위해 앵커를 붙임
+                # ($는 끝의 개행 앞에서도 매칭되므로 fullmatch와 같도록 \Z를 사용)
+                regex = rf'\A(?:{wildcard_to_regex(filter_instance.rule.pattern)})\Z'
+                if shape is not None and shape[0] == '__eq__':
+                    # 와일드카드가 없는 패턴은 태그 전체 일치이므로 정규식 대신 집합으로 판정
+                    exact_tags.append(shape[1])
+                elif shape is not None and shape[0] == 'endswith':
+                    suffixes.append(shape[1])
+                    suffix_regexes.append(regex)
+                    suffix_filters.append(filter_instance)
+                else:
+                    regexes.append(regex)
+                    regex_filters.append(filter_instance)
+            elif is_fusable_regex(filter_instance.rule.pattern):
+                regexes.append(filter_instance.rule.pattern)
+                regex_filters.append(filter_instance)
+            else:
+                # 역참조 등으로 합칠 수 없는 정규식은 개별 필터로 판정
+                fallback.append(filter_instance)
+
+        self._exact_tags = frozenset(exact_tags) if exact_tags else None
+        # 접미사 패턴이 여럿이면 endswith 한 번으로 판정하고, 적으면 교대 패턴에 그대로 둠
+        if len(suffixes) >= _SUFFIX_TUPLE_MIN_PATTERNS:
+            self._suffix_match = methodcaller('endswith', tuple(suffixes))
+        else:
+            self._suffix_match = None
+            regexes.extend(suffix_regexes)
+            regex_filters.extend(suffix_filters)
+        # 키워드가 많고 pyahocorasick이 있으면 정규식 대신 오토마톤으로 검색
+        self._keyword_automaton = build_keyword_automaton(keywords)
+        self._keyword_pattern = build_keyword_pattern(keywords) if self._keyword_automaton is None else None
+        self._union_pattern = build_union_pattern(regexes)
+        if self._union_pattern is None:
+            # 그룹 이름 중복 등으로 교대 패턴 컴파일에 실패하면 해당 필터들을 개별로 판정
+            fallback.extend(regex_filters)
+        self._joined_scanner = compile_joined_scanner(regexes) if self._union_pattern is not None else None
+        self._fallback = tuple(fallback)
+        self._generated = self._build_generated_filter()
+
+    def _build_generated_filter(self) -> Optional[Callable[[List[str]], List[str]]]:
+        """모든 필터가 리터럴 조건이고 개수가 적으면 인라인 생성 함수를 만듦
+
+        태그마다 정규화와 키워드 검색 함수를 호출하던 비용이 사라지는 것이 주된 이득이므로,
+        플레인 키워드가 하나 이상 있을 때만 생성합니다.
+        """
+        if len(self.filters) > _GENERATED_MAX_FILTERS:
+            return None
+
+        shapes: List[tuple[str, str]] = []
+        keywords: List[str] = []
+        for filter_instance in self.filters:
+            if filter_instance.kind == _PLAIN_KEYWORD_KIND:
+                keywords.append(filter_instance.rule.pattern)
+                continue
+            shape = (
+                literal_wildcard_shape(filter_instance.rule.pattern) if filter_instance.kind == _WILDCARD_KIND else None
+            )
+            if shape is None:
+                return None
+            shapes.append(shape)
+        if not keywords:
+            # 와일드카드만 있으면 교대 정규식도 정규화 없이 C 레벨에서 처리되어 이득이 없음
+            return None
+        return _generate_literal_filter(tuple(shapes), tuple(keywords))
+
+    @classmethod
+    def can_fuse(cls, filter_instance: AnyFilter) -> bool:
+        """다중 패턴 필터로 합칠 수 있는 필터인지 확인
+
+        하위 클래스는 ``matches``를 재정의했을 수 있으므로 정확한 타입만 허용합니다.
+        """
+        return type(filter_instance) in cls.fusable_types
+
+    def apply(self, tags: List[str]) -> List[str]:
+        """태그 목록에서 합쳐진 패턴 중 하나라도 매칭되는 태그들을 제거
+
+        패턴 종류별로 태그 목록 전체를 한 번씩 훑습니다.
+        원본 태그에 대한 패턴은 ``filterfalse``로 C 레벨에서 바로 걸러내고,
+        정규화가 필요한 키워드 패턴은 앞 단계에서 남은 태그에만 적용합니다.
+        원본 태그 패턴이 모두 리터럴로 시작하고 태그가 많으면 태그들을 이어 붙여 한 번에 스캔합니다.
+        와일드카드가 없는 와일드카드 패턴은 집합 조회 한 번으로, 접미사 패턴은 ``endswith`` 한 번으로 걸러냅니다.
+        모든 조건이 리터럴이면 조건을 인라인한 생성 함수 하나로 처리합니다.
+        """
+        if self._generated is not None:
+            return self._generated(tags)
+        if self._exact_tags is not None:
+            tags = list(filterfalse(self._exact_tags.__contains__, tags))
+        if self._suffix_match is not None:
+            tags = list(filterfalse(self._suffix_match, tags))
+        if self._union_pattern is not None:
+            if self._joined_scanner is not None and len(tags) >= JOINED_SCAN_MIN_TAGS:
+                tags = filter_joined(self._joined_scanner, self._union_pattern.search, tags)
+            else:
+                tags = list(filterfalse(self._union_pattern.search, tags))
+        if self._keyword_automaton is not None:
+            # 오토마톤 검색 결과의 첫 항목만 확인하여 키워드 포함 여부를 판정
+            keyword_iter = self._keyword_automaton
+            tags = [tag for tag in tags if next(keyword_iter(normalize_tag(tag)), None) is None]
+        elif self._keyword_pattern is not None:
+            keyword_search = self._keyword_pattern.search
+            tags = [tag for tag in tags if not keyword_search(normalize_tag(tag))]
+        # 합칠 수 없는 필터들은 태그마다 any()로 묶지 않고 필터별로 한 번씩 걸러냄
+        # 각 단계가 C 레벨 순회이며 앞 단계에서 제거된 태그는 다시 확인하지 않음
+        for filter_instance in self._fallback:
+            tags = filter_instance.apply(tags)
+        return tags
+
+    def pipeline_step(self) -> tuple[str, Callable[..., Any]]:
+        """생성된 파이프라인에서 호출할 함수 (인라인 생성 함수가 있으면 ``apply``를 거치지 않음)"""
+        return _CALL_STEP, self._generated if self._generated is not None else self.apply
+
+    def matches(self, tag: str) -> bool:
+        """태그가 합쳐진 패턴 중 하나라도 매칭되는지 확인"""
+        if self._exact_tags is not None and tag in self._exact_tags:
+            return True
+        if self._suffix_match is not None and self._suffix_match(tag):
+            return True
+        if self._keyword_automaton is not None:
+            if next(self._keyword_automaton(normalize_tag(tag)), None) is not None:
+                return True
+        elif self._keyword_pattern is not None and self._keyword_pattern.search(normalize_tag(tag)):
+            return True
+        if self._union_pattern is not None and self._union_pattern.search(tag):
+            return True
+        return any(filter_instance.matches(tag) for filter_instance in self._fallback)
+
+    def is_enabled(self) -> bool:
+        """합쳐진 필터는 활성화된 필터로만 구성되므로 항상 True"""
+        return True
+
+    def get_priority(self) -> int:
+        """합쳐진 필터 중 가장 높은 우선순위 반환"""
+        return max(filter_instance.get_priority() for filter_instance in self.filters)
+
+    def __str__(self) -> str:
+        return f'{self.__class__.__name__}({len(self.filters)} filters)'
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class MultiReplaceFilter:
+    """다중 교체 필터
+
+    우선순위상 연속된 교체 필터들을 하나의 사전 조회로 합칩니다.
+    앞 필터가 교체한 태그가 뒤 필터의 교체 대상이 될 수 있으므로,
+    필터들을 순서대로 적용한 최종 결과를 원본 태그별로 사전에 담습니다.
+    """
+
+    __slots__ = ('_replacements', 'filters')
+
+    def __init__(self, filters: Sequence[ReplaceFilter]):
+        self.filters = list(filters)
+
+        replacements: dict[str, str] = {}
+        # 현재 교체 결과 -> 그 결과로 바뀌는 원본 태그들
+        sources: dict[str, List[str]] = {}
+        for filter_instance in self.filters:
+            original_pattern = filter_instance.original_pattern
+            moved = sources.pop(original_pattern, [])
+            if original_pattern not in replacements:
+                # 이미 앞 필터가 교체한 태그라면 이 필터에는 원래 값으로 도달하지 않음
+                moved.append(original_pattern)
+            for tag in moved:
+                replacements[tag] = filter_instance.replacement
+            sources.setdefault(filter_instance.replacement, []).extend(moved)
+        self._replacements = replacements
+
+    @classmethod
+    def can_fuse(cls, filter_instance: AnyFilter) -> bool:
+        """다중 교체 필터로 합칠 수 있는 필터인지 확인
+
+        하위 클래스는 ``apply``를 재정의했을 수 있으므로 정확한 타입만 허용합니다.
+        """
+        return type(filter_instance) is ReplaceFilter
+
+    def apply(self, tags: List[str]) -> List[str]:
+        """태그 목록의 태그들을 합쳐진 교체 결과로 바꿈"""
+        get_replacement = self._replacements.get
+        return [get_replacement(tag, tag) for tag in tags]
+
+    def matches(self, tag: str) -> bool:
+        """태그가 합쳐진 교체 필터 중 하나의 교체 대상인지 확인"""
+        return tag in self._replacements
+
+    def pipeline_step(self) -> tuple[str, Callable[..., Any]]:
+        """생성된 파이프라인에서 사전 조회가 인라인되도록 교체 단계로 표현"""
+        return _REPLACE_STEP, self._replacements.get
+
+    def is_enabled(self) -> bool:
+        """합쳐진 필터는 활성화된 필터로만 구성되므로 항상 True"""
+        return True
+
+    def get_priority(self) -> int:
+        """합쳐진 필터 중 가장 높은 우선순위 반환"""
+        return max(filter_instance.get_priority() for filter_instance in self.filters)
+
+    def __str__(self) -> str:
+        return f'{self.__class__.__name__}({len(self.filters)} filters)'
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+# compile_pipeline이 pipeline_step으로 특수화하는 단계 타입
+_SPECIALIZED_STAGES = (ReplaceFilter, MultiPatternFilter, MultiReplaceFilter)
+
+
+@lru_cache(maxsize=256)
+def _generate_pipeline(steps: tuple[str, ...]) -> Callable[..., Callable[[List[str]], List[str]]]:
+    """단계 종류 배치에 맞춰 단계들을 순서대로 적용하는 함수를 만드는 팩토리 생성
+
+    같은 배치의 엔진들은 생성된 코드를 공유하고, 실제 단계 함수는 팩토리 인자로 바인딩합니다.
+
+    Args:
+        steps: 단계별 종류 (``_CALL_STEP`` 또는 ``_REPLACE_STEP``)
+
+    Returns:
+        단계 함수들을 받아 파이프라인 함수를 돌려주는 팩토리
+    """
+    lines = [f'def make_pipeline({", ".join(f"step{index}" for index in range(len(steps)))}):']
+    lines.append('    def generated_pipeline(tags):')
+    for index, step in enumerate(steps):
+        if step == _REPLACE_STEP:
+            # 교체 단계는 사전 조회를 인라인하며 목록 길이가 그대로이므로 빈 목록 확인이 필요 없음
+            lines.append(f'        tags = [step{index}(tag, tag) for tag in tags]')
+            continue
+        lines.append(f'        tags = step{index}(tags)')
+        if index < len(steps) - 1:
+            # 태그가 모두 제거되면 조기 종료
+            lines.append('        if not tags:')
+            lines.append('            return tags')
+    lines.append('        return tags')
+    lines.append('    return generated_pipeline')
+    return _exec_generated('\n'.join(lines) + '\n', 'make_pipeline')
+
+
+def compile_pipeline(
+    stages: Sequence[AnyFilter | MultiPatternFilter | MultiReplaceFilter],
+) -> Callable[[List[str]], List[str]]:
+    """적용 단계들을 순서대로 적용하는 하나의 함수로 특수화
+
+    규칙 집합은 엔진이 살아 있는 동안 바뀌지 않으므로, 단계마다 반복문을 도는 대신
+    모든 단계 호출을 일렬로 펼친 함수를 생성합니다. 합쳐진 교체 필터의 사전 조회는 인라인하고,
+    인라인 생성 함수가 있는 다중 패턴 필터는 ``apply``를 거치지 않고 생성 함수를 바로 호출합니다.
+    하위 클래스는 ``apply``를 재정의했을 수 있으므로 정확한 타입만 특수화합니다.
+
+    Args:
+        stages: 우선순위 순으로 정렬된 활성 단계들
+
+    Returns:
+        태그 목록에 모든 단계를 적용하는 함수 (결과가 입력 목록 자체일 수 있음)
+    """
+    steps: List[str] = []
+    step_functions: List[Callable[..., Any]] = []
+    for stage in stages:
+        if isinstance(stage, _SPECIALIZED_STAGES) and type(stage) in _SPECIALIZED_STAGES:
+            step, step_function = stage.pipeline_step()
+        else:
+            step, step_function = _CALL_STEP, stage.apply
+        steps.append(step)
+        step_functions.append(step_function)
+    return _generate_pipeline(tuple(steps))(*step_functions)
+
+
+@lru_cache(maxsize=4096)
+def _create_shared_filter(filter_class: type, rule: AnyFilterRule, use_re2: bool) -> AnyFilter:
+    """같은 규칙에 대해 한 번 만든 필터 인스턴스를 재사용
+
+    필터는 생성 시점의 정규식 엔진으로 패턴을 컴파일하므로, ``enable_re2`` 설정을 캐시 키에 포함합니다.
+    """
+    return filter_class(rule)
+
+
 class FilterFactory:
-    """필터 생성 팩토리"""
+    """필터 생성 팩토리
+
+    기본 제공 필터는 생성 후 상태가 바뀌지 않으므로,
+    같은 규칙으로 다시 만들면 캐시된 인스턴스를 엔진 간에 공유합니다.
+    """
 
     _filter_registry = {
         FilterType.PLAIN_KEYWORD: PlainKeywordFilter,
@@ -211,6 +683,9 @@ class FilterFactory:
         FilterType.REPLACE_CAPTURE: ReplaceCaptureFilter,
     }
 
+    # 인스턴스를 공유해도 안전한 기본 제공 필터 클래스 (사용자 등록 필터는 매번 새로 생성)
+    _shared_filter_classes = frozenset(_filter_registry.values())
+
     @classmethod
     def register_filter(cls, filter_type: FilterType, filter_class: type):
         """새로운 필터 타입 등록"""
@@ -232,6 +707,12 @@ class FilterFactory:
         filter_class = cls._filter_registry.get(rule.filter_type)
         if not filter_class:
             raise ValueError(f'Unknown filter type: {rule.filter_type}')
+        if filter_class in cls._shared_filter_classes:
+            try:
+                return _create_shared_filter(filter_class, rule, is_re2_enabled())
+            except TypeError:
+                # 해시할 수 없는 규칙 객체(예: 설정 모델)는 캐시 없이 생성
+                pass
         return filter_class(rule)
 
     @classmethod
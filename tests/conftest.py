@@ -1,6 +1,48 @@
 import pytest
 
+from sd_tagfilter.config import ConfigLoader, TagFilterConfig
+
+from .helpers import write_json
+
+# 접근자 메서드 테스트가 함께 쓰는 기준 설정: 활성/비활성, 우선순위, 그룹 규칙을 모두 포함
+SAMPLE_CONFIG = {
+    'version': '1.0',
+    'rules': [
+        {
+            'filter_type': 'plain_keyword',
+            'pattern': 'enabled_rule',
+            'priority': 50,
+            'enabled': True,
+            'description': '테스트 규칙',
+        },
+        {'filter_type': 'plain_keyword', 'pattern': 'disabled_rule', 'priority': 40, 'enabled': False},
+        {'filter_type': 'regex', 'pattern': '\\btest\\b', 'priority': 30, 'enabled': True},
+        {
+            'filter_type': 'group',
+            'patterns': ['a', 'b'],
+            'priority': 60,
+            'enabled': True,
+            'description': '그룹 규칙',
+        },
+    ],
+}
+
 
 @pytest.fixture
 def anyio_backend():
     return 'asyncio'
+
+
+@pytest.fixture(scope='session')
+def sample_config(tmp_path_factory: pytest.TempPathFactory) -> TagFilterConfig:
+    """기준 설정 파일을 한 번만 써서 읽은 설정 (테스트에서 수정하지 말 것)"""
+    file_path = tmp_path_factory.mktemp('config') / 'sample.json'
+    write_json(file_path, SAMPLE_CONFIG)
+    return ConfigLoader.load_from_json(file_path)
+
+
+@pytest.fixture(scope='session')
+def sample_yaml_config() -> TagFilterConfig:
+    """기준 설정을 YAML 문서로 바꿔 세션에서 한 번만 파싱한 설정 (테스트에서 수정하지 말 것)"""
+    yaml = pytest.importorskip('yaml')
+    return ConfigLoader.load_from_yaml_string(yaml.safe_dump(SAMPLE_CONFIG, allow_unicode=True))
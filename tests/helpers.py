@@ -0,0 +1,18 @@
+"""테스트 공용 도우미"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def write_json(file_path: Path, data: Any) -> None:
+    """테스트 데이터를 들여쓴 JSON 파일로 저장 (orjson이 있으면 orjson으로 직렬화)"""
+    if orjson is not None:
+        file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        file_path.write_text(json.dumps(data, indent=2), encoding='utf-8')
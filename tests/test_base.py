@@ -9,6 +9,8 @@ from sd_tagfilter import (
     FilterType,
     GroupFilterRule,
 )
+from sd_tagfilter.config import FilterRuleRecord, GroupFilterRuleRecord
+from sd_tagfilter.filters import FilterFactory, PlainKeywordFilter
 
 
 class TestFilterType:
@@ -117,6 +119,14 @@ class TestGroupFilterRule:
         assert rule.enabled is True
         assert rule.description is None
 
+    def test_group_filter_rule_from_list_dedupes_patterns(self):
+        """from_list가 순서를 유지하며 중복 패턴을 제거하는지 확인"""
+        rule = GroupFilterRule.from_list(patterns=['steam', 'sweat', 'steam', 'blush', 'sweat'])
+
+        assert rule.patterns == ('steam', 'sweat', 'blush')
+        assert rule == GroupFilterRule.from_list(patterns=['steam', 'sweat', 'blush'])
+        assert hash(rule) == hash(GroupFilterRule.from_list(patterns=['steam', 'sweat', 'blush']))
+
     def test_group_filter_rule_from_list(self):
         """from_list 클래스 메서드 테스트"""
         patterns = ['steam', 'sweat', 'blush']
@@ -242,3 +252,74 @@ class TestFilterRuleHashing:
         # 동일한 규칙을 추가해도 set 크기는 변하지 않아야 함
         rule_set.add(rule)
         assert len(rule_set) == 1
+
+
+class TestFilterSlots:
+    """필터 인스턴스 메모리 레이아웃 테스트"""
+
+    def test_filters_have_no_instance_dict(self):
+        """기본 제공 필터들이 __dict__ 없이 __slots__만 사용하는지 확인"""
+        rules = [
+            FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern='test'),
+            FilterRule(filter_type=FilterType.WILDCARD, pattern='*_hair'),
+            FilterRule(filter_type=FilterType.REGEX, pattern='test.*'),
+            FilterRule(filter_type=FilterType.REPLACE, pattern='old||new'),
+            FilterRule(filter_type=FilterType.REPLACE_CAPTURE, pattern='(.*)_old||$1_new'),
+            GroupFilterRule.from_list(patterns=['steam', 'sweat']),
+        ]
+
+        for rule in rules:
+            filter_instance = FilterFactory.create_filter(rule)
+            assert not hasattr(filter_instance, '__dict__')
+
+    def test_rules_have_no_instance_dict(self):
+        """규칙 튜플과 설정에 저장되는 규칙 레코드도 인스턴스마다 __dict__를 두지 않는지 확인"""
+        instances = [
+            FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern='test'),
+            GroupFilterRule.from_list(patterns=['steam', 'sweat']),
+            FilterRuleRecord(filter_type=FilterType.PLAIN_KEYWORD, pattern='test'),
+            GroupFilterRuleRecord(patterns=['steam', 'sweat']),
+        ]
+
+        for instance in instances:
+            assert not hasattr(instance, '__dict__'), type(instance).__name__
+
+
+class TestFilterFactoryCache:
+    """필터 인스턴스 공유 테스트"""
+
+    def test_equal_rules_share_filter_instance(self):
+        """같은 규칙으로 만든 필터는 재사용되고, 우선순위가 다르면 별도 인스턴스인지 확인"""
+        rule = FilterRule(filter_type=FilterType.REGEX, pattern='test.*', priority=10)
+
+        assert FilterFactory.create_filter(rule) is FilterFactory.create_filter(rule._replace())
+        assert FilterFactory.create_filter(rule._replace(priority=20)).get_priority() == 20
+
+    def test_registered_filters_are_not_shared(self):
+        """사용자가 등록한 필터 클래스는 매번 새로 생성되는지 확인"""
+
+        class CustomFilter(PlainKeywordFilter):
+            __slots__ = ()
+
+        FilterFactory.register_filter(FilterType.PLAIN_KEYWORD, CustomFilter)
+        try:
+            rule = FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern='test')
+            assert FilterFactory.create_filter(rule) is not FilterFactory.create_filter(rule)
+        finally:
+            FilterFactory.register_filter(FilterType.PLAIN_KEYWORD, PlainKeywordFilter)
+
+
+class TestApplyChecked:
+    """단독 사용 시 활성화 여부 확인 테스트"""
+
+    def test_apply_checked_skips_disabled_filters(self):
+        """비활성화된 필터는 apply_checked에서 태그를 그대로 돌려주는지 확인"""
+        tags = ['nsfw', 'steam', 'sweat', 'smile']
+        keyword_rule = FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern='nsfw', enabled=False)
+        group_rule = GroupFilterRule.from_list(['steam', 'sweat'], enabled=False)
+
+        for rule, expected in [(keyword_rule, ['steam', 'sweat', 'smile']), (group_rule, ['nsfw', 'smile'])]:
+            filter_instance = FilterFactory.create_filter(rule)
+            assert filter_instance.apply_checked(tags) == tags
+            assert filter_instance.apply(tags) == expected
+            assert FilterFactory.create_filter(rule._replace(enabled=True)).apply_checked(tags) == expected
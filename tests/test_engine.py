@@ -0,0 +1,546 @@
+"""
+태그 필터링 엔진 내부 동작 테스트
+
+최적화된 적용 단계가 필터를 하나씩 순차 적용한 결과와 같은지 검증합니다.
+"""
+
+import gc
+import inspect
+import linecache
+import random
+import re
+import sys
+from typing import List
+
+import pytest
+
+from sd_tagfilter import (
+    FilterRule,
+    FilterType,
+    GroupFilterRule,
+    OptimizedTagFilterEngine,
+    TagFilterEngine,
+)
+from sd_tagfilter.engine import MemoryEfficientFilterEngine
+from sd_tagfilter.filters import (
+    FilterFactory,
+    GroupFilter,
+    MultiPatternFilter,
+    MultiReplaceFilter,
+    RegexFilter,
+    WildcardFilter,
+    _generate_literal_filter,  # pyright: ignore[reportPrivateUsage]
+    normalize_tag,
+)
+from sd_tagfilter.patterns import JOINED_SCAN_MIN_TAGS, compile_joined_scanner, enable_re2
+
+
+def apply_sequentially(engine: TagFilterEngine, tags: List[str]) -> List[str]:
+    """최적화 없이 필터를 우선순위 순으로 하나씩 적용"""
+    for filter_instance in engine.get_filters_by_priority():
+        tags = filter_instance.apply(tags)
+    return tags
+
+
+SAMPLE_TAGS = [
+    'red_hair',
+    'Blue Hair',
+    'steam',
+    'sweat',
+    'blush',
+    'smile',
+    'nude',
+    'nsfw_content',
+    'NSFW art',
+    'bad_word',
+    'something_old',
+    'aa',
+    'normal_tag',
+]
+
+
+class TestFilterPipeline:
+    """필터 적용 단계 구성 테스트"""
+
+    def test_consecutive_removal_filters_are_fused(self):
+        """연속된 제거 필터들이 하나의 단계로 합쳐지는지 확인"""
+        rules = [
+            FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern='nsfw', priority=60),
+            FilterRule(filter_type=FilterType.WILDCARD, pattern='*_hair', priority=50),
+            FilterRule(filter_type=FilterType.REGEX, pattern=r'\b(nude|naked)\b', priority=40),
+        ]
+
+        engine = TagFilterEngine(rules)
+
+        assert len(engine._pipeline) == 1  # pyright: ignore[reportPrivateUsage]
+        assert isinstance(engine._pipeline[0], MultiPatternFilter)  # pyright: ignore[reportPrivateUsage]
+        assert engine.filter_tags(SAMPLE_TAGS) == apply_sequentially(engine, SAMPLE_TAGS)
+
+    def test_regexes_with_duplicate_group_names_are_not_dropped(self):
+        """그룹 이름이 겹쳐 교대 패턴으로 합칠 수 없는 정규식도 각각 적용되는지 확인"""
+        rules = [
+            FilterRule(filter_type=FilterType.REGEX, pattern=r'(?P<x>a)x', priority=20),
+            FilterRule(filter_type=FilterType.REGEX, pattern=r'(?P<x>b)y', priority=10),
+            FilterRule(filter_type=FilterType.WILDCARD, pattern='*_hair', priority=5),
+        ]
+        tags = ['ax', 'by', 'blue_hair', 'cz']
+        engine = TagFilterEngine(rules)
+
+        assert engine.filter_tags(tags) == ['cz']
+        assert engine.filter_tags(tags) == apply_sequentially(engine, tags)
+
+    def test_fused_wildcards_match_whole_tag(self):
+        """합쳐진 와일드카드도 단독 필터처럼 끝에 개행이 붙은 태그와 매칭되지 않는지 확인"""
+        tags = ['red_hair', 'red_hair\n', 'blue_eyes\n']
+        alone = TagFilterEngine([FilterRule(filter_type=FilterType.WILDCARD, pattern='*_hair')])
+        fused = TagFilterEngine(
+            [
+                FilterRule(filter_type=FilterType.WILDCARD, pattern='*_hair'),
+                FilterRule(filter_type=FilterType.WILDCARD, pattern='b*e_eyes'),
+            ]
+        )
+
+        assert isinstance(fused._pipeline[0], MultiPatternFilter)  # pyright: ignore[reportPrivateUsage]
+        assert alone.filter_tags(tags) == ['red_hair\n', 'blue_eyes\n']
+        assert fused.filter_tags(tags) == ['red_hair\n', 'blue_eyes\n']
+        assert fused.filter_tags(tags) == apply_sequentially(fused, tags)
+
+    def test_exact_wildcards_fused_into_set_lookup(self):
+        """와일드카드가 없는 와일드카드 규칙은 정규식 대신 집합 조회로 판정하는지 확인"""
+        rules = [
+            FilterRule(filter_type=FilterType.WILDCARD, pattern='steam'),
+            FilterRule(filter_type=FilterType.WILDCARD, pattern='Blue Hair'),
+            FilterRule(filter_type=FilterType.WILDCARD, pattern='*_old'),
+            FilterRule(filter_type=FilterType.REGEX, pattern=r'^n'),
+        ]
+        engine = TagFilterEngine(rules)
+        stage = engine._pipeline[0]  # pyright: ignore[reportPrivateUsage]
+
+        assert isinstance(stage, MultiPatternFilter)
+        assert stage._exact_tags == {'steam', 'Blue Hair'}  # pyright: ignore[reportPrivateUsage]
+        assert engine.filter_tags(SAMPLE_TAGS) == apply_sequentially(engine, SAMPLE_TAGS)
+        assert [tag for tag in SAMPLE_TAGS if not stage.matches(tag)] == apply_sequentially(engine, SAMPLE_TAGS)
+
+    def test_suffix_wildcards_fused_into_endswith(self):
+        """접미사 와일드카드가 여럿이면 endswith 튜플로 판정하는지 확인"""
+        rules = [
+            FilterRule(filter_type=FilterType.WILDCARD, pattern='*_hair'),
+            FilterRule(filter_type=FilterType.WILDCARD, pattern='*_old'),
+            FilterRule(filter_type=FilterType.WILDCARD, pattern='*art'),
+            FilterRule(filter_type=FilterType.REGEX, pattern=r'^n'),
+        ]
+        engine = TagFilterEngine(rules)
+        stage = engine._pipeline[0]  # pyright: ignore[reportPrivateUsage]
+
+        assert isinstance(stage, MultiPatternFilter)
+        assert stage._suffix_match is not None  # pyright: ignore[reportPrivateUsage]
+        assert engine.filter_tags(SAMPLE_TAGS) == apply_sequentially(engine, SAMPLE_TAGS)
+        assert [tag for tag in SAMPLE_TAGS if not stage.matches(tag)] == apply_sequentially(engine, SAMPLE_TAGS)
+
+    def test_plain_and_wildcard_rules_fused_into_single_stage(self):
+        """플레인 키워드와 와일드카드 규칙이 우선순위와 무관하게 한 단계로 합쳐지는지 확인"""
+        rng = random.Random(0)
+        alphabet = 'ab_ A'
+        rules = [
+            FilterRule(
+                filter_type=rng.choice([FilterType.PLAIN_KEYWORD, FilterType.WILDCARD]),
+                pattern=''.join(rng.choice('ab_*') for _ in range(rng.randint(1, 4))),
+                priority=rng.randint(0, 100),
+            )
+            for _ in range(12)
+        ]
+        engine = TagFilterEngine(rules)
+
+        assert len(engine._pipeline) == 1  # pyright: ignore[reportPrivateUsage]
+        for _ in range(200):
+            tags = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 6))) for _ in range(8)]
+            assert engine.filter_tags(tags) == apply_sequentially(engine, tags)
+
+    def test_many_keywords_fused_into_trie(self):
+        """키워드가 많을 때 접두사 트리 패턴이 부분 문자열 매칭과 같은 결과를 내는지 확인"""
+        keywords = ['nsfw', 'nude', 'nu', 'naked', 'bad', 'bad_word', 'old', 'a.b', 'sweat']
+        rules = [FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern=keyword) for keyword in keywords]
+        tags = SAMPLE_TAGS + ['a.b_tag', 'axb_tag', 'menu', 'Nu Style']
+
+        engine = TagFilterEngine(rules)
+
+        assert isinstance(engine._pipeline[0], MultiPatternFilter)  # pyright: ignore[reportPrivateUsage]
+        assert engine.filter_tags(tags) == apply_sequentially(engine, tags)
+        assert 'axb_tag' in engine.filter_tags(tags)
+
+    def test_small_literal_runs_use_generated_filter(self):
+        """리터럴 조건만 있는 작은 묶음이 생성 함수로 처리되고 결과가 같은지 확인"""
+        rules = [
+            FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern="it's", priority=30),
+            FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern='nsfw', priority=20),
+            FilterRule(filter_type=FilterType.WILDCARD, pattern='*_hair', priority=10),
+            FilterRule(filter_type=FilterType.WILDCARD, pattern='something*', priority=10),
+        ]
+        tags = SAMPLE_TAGS + ["It's Fine", 'its_fine']
+
+        engine = TagFilterEngine(rules)
+        stage = engine._pipeline[0]  # pyright: ignore[reportPrivateUsage]
+
+        assert isinstance(stage, MultiPatternFilter)
+        generated = stage._generated  # pyright: ignore[reportPrivateUsage]
+        assert generated is not None
+        assert "tag.endswith('_hair')" in inspect.getsource(generated)
+        assert engine.filter_tags(tags) == apply_sequentially(engine, tags)
+
+    def test_generated_source_released_with_function(self):
+        """캐시에서 밀려나 해제된 생성 함수의 소스가 linecache에 남지 않는지 확인"""
+        generated = _generate_literal_filter((('endswith', '_released'),), ('released_kw',))
+        filename = generated.__code__.co_filename
+        assert filename in linecache.cache
+
+        del generated
+        _generate_literal_filter.cache_clear()
+        gc.collect()
+
+        assert filename not in linecache.cache
+
+    def test_fusion_respects_non_removal_boundaries(self):
+        """교체/그룹 필터 사이의 순서가 유지되는지 확인"""
+        rules = [
+            GroupFilterRule.from_list(patterns=['steam', 'sweat', 'blush'], priority=100),
+            FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern='good', priority=80),
+            FilterRule(filter_type=FilterType.REPLACE, pattern='bad_word||good_word', priority=70),
+            FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern='word', priority=60),
+            FilterRule(filter_type=FilterType.REPLACE_CAPTURE, pattern=r'(.*)_old||$1_new', priority=50),
+            FilterRule(filter_type=FilterType.WILDCARD, pattern='*_new', priority=40),
+            FilterRule(filter_type=FilterType.REGEX, pattern=r'(a)\1', priority=30),
+        ]
+
+        engine = TagFilterEngine(rules)
+
+        assert engine.filter_tags(SAMPLE_TAGS) == apply_sequentially(engine, SAMPLE_TAGS)
+        assert 'something_new' not in engine.filter_tags(SAMPLE_TAGS)
+        assert 'aa' not in engine.filter_tags(SAMPLE_TAGS)
+
+    def test_consecutive_replace_filters_are_fused(self):
+        """연속된 교체 필터가 하나로 합쳐지고 교체 연쇄가 순서대로 반영되는지 확인"""
+        rules = [
+            FilterRule(filter_type=FilterType.REPLACE, pattern='a||b', priority=90),
+            FilterRule(filter_type=FilterType.REPLACE, pattern='b||c', priority=80),
+            FilterRule(filter_type=FilterType.REPLACE, pattern='c||a', priority=70),
+            FilterRule(filter_type=FilterType.REPLACE, pattern='d||d', priority=60),
+            FilterRule(filter_type=FilterType.REPLACE, pattern='d||e', priority=50),
+        ]
+        engine = TagFilterEngine(rules)
+        tags = ['a', 'b', 'c', 'd', 'e']
+
+        assert len(engine._pipeline) == 1  # pyright: ignore[reportPrivateUsage]
+        assert isinstance(engine._pipeline[0], MultiReplaceFilter)  # pyright: ignore[reportPrivateUsage]
+        assert engine.filter_tags(tags) == apply_sequentially(engine, tags) == ['a', 'a', 'a', 'e', 'e']
+
+    def test_pipeline_compiled_into_single_function(self):
+        """적용 단계들이 일렬로 펼친 하나의 생성 함수로 실행되는지 확인"""
+        rules = [
+            GroupFilterRule.from_list(patterns=['steam', 'sweat', 'blush'], priority=100),
+            FilterRule(filter_type=FilterType.REPLACE, pattern='bad_word||good_word', priority=70),
+            FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern='word', priority=60),
+        ]
+        engine = TagFilterEngine(rules)
+        source = inspect.getsource(engine._run_pipeline)  # pyright: ignore[reportPrivateUsage]
+
+        assert 'for tag in tags' in source
+        assert source.count('if not tags') == 1
+        assert engine.filter_tags(SAMPLE_TAGS) == apply_sequentially(engine, SAMPLE_TAGS)
+
+    def test_pipeline_rebuilt_on_rule_changes(self):
+        """규칙 추가/제거 시 적용 단계가 다시 구성되는지 확인"""
+        engine = TagFilterEngine([FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern='nsfw')])
+        new_rule = FilterRule(filter_type=FilterType.WILDCARD, pattern='*_hair')
+
+        engine.add_rule(new_rule)
+        assert 'red_hair' not in engine.filter_tags(SAMPLE_TAGS)
+
+        engine.remove_rule(new_rule)
+        assert 'red_hair' in engine.filter_tags(SAMPLE_TAGS)
+
+        engine.clear_rules()
+        assert engine.filter_tags(SAMPLE_TAGS) == SAMPLE_TAGS
+
+    def test_incremental_updates_keep_priority_order(self):
+        """규칙 추가/제거 후에도 전체를 다시 정렬한 것과 같은 순서인지 확인"""
+        rules = [
+            FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern=f'kw{index}', priority=index % 3)
+            for index in range(6)
+        ]
+        engine = TagFilterEngine(rules[:3])
+        for rule in rules[3:]:
+            engine.add_rule(rule)
+        engine.remove_rule(rules[1])
+
+        expected = TagFilterEngine([rule for rule in rules if rule is not rules[1]])
+        assert [f.rule for f in engine.get_filters_by_priority()] == [
+            f.rule for f in expected.get_filters_by_priority()
+        ]
+
+    def test_unknown_filter_type_logged_and_skipped(self, caplog: pytest.LogCaptureFixture):
+        """알 수 없는 필터 타입은 경고 로그를 남기고 건너뛰는지 확인"""
+        rule = FilterRule(filter_type='bogus', pattern='x')  # pyright: ignore[reportArgumentType]
+
+        with caplog.at_level('WARNING', logger='sd_tagfilter.engine'):
+            engine = TagFilterEngine([rule])
+            engine.add_rule(rule)
+
+        assert engine.get_filter_count() == 0
+        assert [record.getMessage() for record in caplog.records] == [
+            'Unknown filter type: bogus',
+            'Failed to add rule: Unknown filter type: bogus',
+        ]
+
+
+class TestJoinedScan:
+    """이어 붙인 태그 스캔 테스트"""
+
+    def test_joined_scan_matches_per_tag_filtering(self):
+        """큰 태그 목록에서 한 번에 스캔한 결과가 태그별 판정과 같은지 확인"""
+        rules = [
+            FilterRule(filter_type=FilterType.REGEX, pattern='nsfw_.*', priority=60),
+            FilterRule(filter_type=FilterType.REGEX, pattern='old$', priority=50),
+            FilterRule(filter_type=FilterType.REGEX, pattern=r'a[^b]c', priority=40),
+        ]
+        # 태그 경계를 넘는 매칭(...a / c...)과 줄바꿈이 포함된 태그를 섞음
+        tags = ['nsfw_art', 'a', 'c', 'something_old', 'old_tag', 'normal'] * JOINED_SCAN_MIN_TAGS
+        engine = TagFilterEngine(rules)
+
+        stage = engine._pipeline[0]  # pyright: ignore[reportPrivateUsage]
+        assert isinstance(stage, MultiPatternFilter)
+        assert stage._joined_scanner is not None  # pyright: ignore[reportPrivateUsage]
+        assert engine.filter_tags(tags) == apply_sequentially(engine, tags)
+        assert engine.filter_tags(tags + ['a\nc']) == apply_sequentially(engine, tags + ['a\nc'])
+
+        single = RegexFilter(rules[0])
+        assert single.apply(tags) == [tag for tag in tags if not single.matches(tag)]
+
+    def test_anchored_patterns_skip_joined_scan(self):
+        """리터럴로 시작하지 않는 패턴은 이어 붙인 스캔을 사용하지 않는지 확인"""
+        assert compile_joined_scanner(['^temp_']) is None
+        assert compile_joined_scanner([r'\bnude\b']) is None
+        assert compile_joined_scanner(['nude|naked']) is None
+        assert compile_joined_scanner([r'nsfw\Z']) is None
+        assert compile_joined_scanner(['nsfw', 'bad_.*']) is not None
+
+
+class TestOptimizedEngine:
+    """최적화 엔진 테스트"""
+
+    def test_only_rule_strings_are_interned(self):
+        """교체 결과는 인턴된 하나의 객체를 공유하고, 입력 태그는 인턴하지 않는지 확인"""
+        engine = OptimizedTagFilterEngine(
+            [FilterRule(filter_type=FilterType.REPLACE, pattern='bad_word||good_word')],
+        )
+        # 상수 문자열은 컴파일 시 인턴되므로 실행 중에 새 문자열 객체를 만듦
+        parts = ['smile', '_unique']
+        tag = ''.join(parts)
+        first = engine.filter_tags([tag, 'bad_word'])
+        second = engine.filter_tags([''.join(parts), 'bad_word'])
+
+        assert first == second == ['smile_unique', 'good_word']
+        assert first[0] is tag
+        assert first[0] is not second[0]
+        assert first[1] is second[1] is sys.intern('good_word')
+
+    def test_patterns_compiled_at_engine_build(self, monkeypatch: pytest.MonkeyPatch):
+        """정규식과 그룹 패턴이 엔진 생성 시점에 모두 컴파일되는지 확인"""
+        rules = [
+            FilterRule(filter_type=FilterType.REGEX, pattern=r'^x_\d+$', priority=90),
+            FilterRule(filter_type=FilterType.WILDCARD, pattern='*_hair', priority=80),
+            FilterRule(filter_type=FilterType.REPLACE_CAPTURE, pattern=r'(\w+)_eyes||\1 eyes', priority=70),
+            GroupFilterRule.from_list(patterns=['steam', 'sweat'], priority=100),
+        ]
+        engine = OptimizedTagFilterEngine(rules)
+
+        def fail_compile(*args: object, **kwargs: object):
+            raise AssertionError('pattern compiled during filtering')
+
+        monkeypatch.setattr(re, 'compile', fail_compile)
+        assert engine.filter_tags(['x_1', 'red_hair', 'blue_eyes', 'steam', 'sweat', 'smile']) == [
+            'blue eyes',
+            'smile',
+        ]
+
+    def test_patterns_compiled_when_rules_change(self, monkeypatch: pytest.MonkeyPatch):
+        """규칙을 추가/제거할 때 컴파일이 끝나고 filter_tags에서는 컴파일하지 않는지 확인"""
+        engine = TagFilterEngine([FilterRule(filter_type=FilterType.WILDCARD, pattern='*_hair')])
+        engine.add_rule(FilterRule(filter_type=FilterType.REGEX, pattern=r'^added_\d+$'))
+        engine.add_rule(FilterRule(filter_type=FilterType.REPLACE_CAPTURE, pattern=r'(\w+)_old||$1_new'))
+        engine.remove_rule(FilterRule(filter_type=FilterType.WILDCARD, pattern='*_hair'))
+
+        def fail_compile(*args: object, **kwargs: object):
+            raise AssertionError('pattern compiled during filtering')
+
+        monkeypatch.setattr(re, 'compile', fail_compile)
+        assert engine.filter_tags(['added_1', 'red_hair', 'thing_old']) == ['red_hair', 'thing_new']
+
+
+class TestFilterTagsMany:
+    """여러 태그 목록 일괄 필터링 테스트"""
+
+    def test_matches_per_list_filtering(self):
+        """목록별로 filter_tags를 호출한 결과와 같은지 확인"""
+        rules = [
+            GroupFilterRule.from_list(patterns=['steam', 'sweat'], priority=100),
+            FilterRule(filter_type=FilterType.REPLACE, pattern='bad_word||good_word', priority=80),
+            FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern='good', priority=70),
+            FilterRule(filter_type=FilterType.REPLACE_CAPTURE, pattern=r'(.*)_old||$1_new', priority=60),
+            FilterRule(filter_type=FilterType.WILDCARD, pattern='*_hair', priority=50),
+            GroupFilterRule.from_list(patterns=['something_new', 'smile'], priority=40),
+        ]
+        engine = TagFilterEngine(rules)
+        tag_batches = [
+            SAMPLE_TAGS,
+            ['steam', 'smile', 'something_old'],
+            [],
+            ['bad_word', 'nude', 'red_hair', 'smile'],
+            ['sweat', 'steam', 'something_old', 'smile', 'aa'],
+        ]
+
+        assert engine.filter_tags_many(tag_batches) == [engine.filter_tags(tags) for tags in tag_batches]
+
+    def test_optimized_engine_records_stats(self):
+        """최적화 엔진의 일괄 처리가 통계에 반영되는지 확인"""
+        engine = OptimizedTagFilterEngine([FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern='nsfw')])
+        results = engine.filter_tags_batch([['nsfw', 'smile'], ['NSFW art', 'blush', 'nsfw_content']])
+
+        assert results == [['smile'], ['blush']]
+        assert engine.stats.total_processed == 5
+        assert engine.stats.total_filtered == 3
+
+
+class TestStreamingColumns:
+    """스트리밍 판정용 열 데이터 테스트"""
+
+    def test_columns_follow_rule_changes(self):
+        """규칙 추가/초기화 시 개별 태그 판정 열이 다시 구성되는지 확인"""
+        engine = MemoryEfficientFilterEngine(
+            [GroupFilterRule.from_list(patterns=['steam', 'sweat'], priority=100)],
+        )
+        assert engine._removal_matchers == ()  # pyright: ignore[reportPrivateUsage]
+
+        engine.add_rule(FilterRule(filter_type=FilterType.REPLACE, pattern='bad_word||good_word'))
+        assert engine._removal_matchers == ()  # pyright: ignore[reportPrivateUsage]
+
+        engine.add_rule(FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern='bad'))
+        assert len(engine._removal_matchers) == 1  # pyright: ignore[reportPrivateUsage]
+        assert engine._removal_matchers[0]('bad_word')  # pyright: ignore[reportPrivateUsage]
+
+        engine.clear_rules()
+        assert list(engine.filter_tags_stream(iter(SAMPLE_TAGS))) == SAMPLE_TAGS
+
+    def test_stream_removes_only_removal_matches(self):
+        """스트리밍 시 제거 필터에 매칭된 태그만 제거되고 교체 대상 태그는 유지되는지 확인"""
+        engine = MemoryEfficientFilterEngine(
+            [
+                FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern='nsfw', priority=90),
+                FilterRule(filter_type=FilterType.WILDCARD, pattern='*_hair', priority=80),
+                FilterRule(filter_type=FilterType.REPLACE, pattern='bad_word||good_word', priority=70),
+                FilterRule(filter_type=FilterType.REGEX, pattern=r'^x\d$', priority=60),
+                GroupFilterRule.from_list(patterns=['steam', 'sweat'], priority=100),
+            ]
+        )
+        tags = ['NSFW art', 'red_hair', 'bad_word', 'x1', 'steam', 'sweat', 'smile']
+
+        assert list(engine.filter_tags_stream(iter(tags))) == ['bad_word', 'steam', 'sweat', 'smile']
+
+
+class TestGroupFilterMatching:
+    """그룹 필터 매칭 테스트"""
+
+    def test_group_matches_exact_and_substring_patterns(self):
+        """정확히 일치하는 패턴과 부분 문자열 패턴이 섞여 있어도 그룹이 제거되는지 확인"""
+        rules = [GroupFilterRule.from_list(patterns=['steam', 'sweat', 'blush'], priority=100)]
+        engine = TagFilterEngine(rules)
+
+        tags = ['Steam', 'heavy sweat', 'light_blush', 'smile']
+
+        assert engine.filter_tags(tags) == ['smile']
+        assert engine.filter_tags(['steam', 'sweat', 'smile']) == ['steam', 'sweat', 'smile']
+
+    def test_group_matches_with_patterns_spanning_tags(self):
+        """여러 태그에 걸친 부분 문자열이나 빈 태그 목록으로 그룹이 잘못 매칭되지 않는지 확인"""
+        group = GroupFilter(GroupFilterRule.from_list(patterns=['a_b', 'steam']))
+
+        assert not group.matches(['xa', 'b_steam'])
+        assert group.matches(['xa_b', 'steam'])
+        assert not GroupFilter(GroupFilterRule.from_list(patterns=[''])).matches([])
+
+
+class TestWildcardMatching:
+    """와일드카드 필터 매칭 테스트"""
+
+    def test_literal_shapes_match_like_regex(self):
+        """리터럴 형태의 패턴이 정규식 변환 결과와 같은 판정을 하는지 확인"""
+        tags = ['red_hair', 'hair_band', 'long_hair_style', 'hair', 'hat', '']
+        for pattern in ['*_hair', 'hair_*', '*hair*', 'hair', '*', 'h*r', 'ha?']:
+            filter_instance = WildcardFilter(FilterRule(filter_type=FilterType.WILDCARD, pattern=pattern))
+            compiled_pattern = filter_instance._compiled_pattern  # pyright: ignore[reportPrivateUsage]
+            for tag in tags:
+                assert filter_instance.matches(tag) == bool(compiled_pattern.fullmatch(tag))
+
+
+class TestRegexBackend:
+    """정규식 엔진 선택 테스트"""
+
+    def test_re2_backend_matches_like_stdlib(self):
+        """RE2를 켜도 ASCII 태그에 대한 필터링 결과가 같은지 확인"""
+        pytest.importorskip('re2')
+        rules = [
+            FilterRule(filter_type=FilterType.REGEX, pattern=r'\b(nude|naked)\b', priority=70),
+            FilterRule(filter_type=FilterType.REGEX, pattern=r'(a)\1', priority=60),
+            FilterRule(filter_type=FilterType.WILDCARD, pattern='*_hair', priority=50),
+        ]
+        expected = TagFilterEngine(rules).filter_tags(SAMPLE_TAGS)
+
+        enable_re2()
+        try:
+            assert TagFilterEngine(rules).filter_tags(SAMPLE_TAGS) == expected
+        finally:
+            enable_re2(False)
+
+    def test_shared_filters_follow_re2_setting(self):
+        """RE2를 켠 뒤 만든 필터는 캐시된 표준 re 필터 대신 RE2로 컴파일한 필터인지 확인"""
+        pytest.importorskip('re2')
+        rule = FilterRule(filter_type=FilterType.REGEX, pattern=r'\b(nude|naked)\b')
+        stdlib_filter = FilterFactory.create_filter(rule)
+
+        enable_re2()
+        try:
+            re2_filter = FilterFactory.create_filter(rule)
+            assert isinstance(re2_filter, RegexFilter)
+            assert re2_filter is not stdlib_filter
+            assert type(re2_filter._compiled_pattern).__module__ == 're2'  # pyright: ignore[reportPrivateUsage]
+        finally:
+            enable_re2(False)
+
+        assert FilterFactory.create_filter(rule) is stdlib_filter
+
+    def test_keyword_automaton_matches_like_substring_search(self):
+        """키워드가 많아 Aho-Corasick 오토마톤을 쓰더라도 부분 문자열 판정과 같은지 확인"""
+        pytest.importorskip('ahocorasick')
+        keywords = [f'kw{i}' for i in range(20)] + ['hair', 'blue_eyes', 'smil']
+        rules = [FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern=keyword) for keyword in keywords]
+        engine = TagFilterEngine(rules)
+        stage = engine._pipeline[0]  # pyright: ignore[reportPrivateUsage]
+        assert isinstance(stage, MultiPatternFilter)
+        assert stage._keyword_automaton is not None  # pyright: ignore[reportPrivateUsage]
+
+        tags = SAMPLE_TAGS + ['KW7 tag', 'kw', 'Blue Eyes', 'blue_eye']
+        expected = [tag for tag in tags if not any(keyword in normalize_tag(tag) for keyword in keywords)]
+        assert engine.filter_tags(tags) == expected
+        assert [tag for tag in tags if not stage.matches(tag)] == expected
+
+    def test_group_keyword_automaton_matches_like_substring_search(self):
+        """그룹 패턴이 많아 오토마톤을 쓰더라도 그룹 판정과 제거 결과가 같은지 확인"""
+        pytest.importorskip('ahocorasick')
+        patterns = tuple(f'kw{i}' for i in range(20)) + ('hair', 'smil')
+        group_filter = GroupFilter(GroupFilterRule(filter_type=FilterType.GROUP, patterns=patterns))
+        assert group_filter._pattern_automaton is not None  # pyright: ignore[reportPrivateUsage]
+
+        tags = SAMPLE_TAGS + [f'KW{i} tag' for i in range(20)]
+        expected = [tag for tag in SAMPLE_TAGS if 'hair' not in tag.lower() and 'smil' not in tag]
+        assert group_filter.apply(tags) == expected
+        # 패턴 하나라도 빠지면 아무것도 제거하지 않음
+        assert group_filter.apply(tags[:-1]) == tags[:-1]
@@ -1,4 +1,3 @@
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -19,14 +18,11 @@ dark_side
 
 
 @pytest.fixture
-def tagFilterConfig(text_config: str):
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        f.write(text_config)
-        f.flush()
+def tagFilterConfig(text_config: str, tmp_path: Path):
+    file_path = tmp_path / 'config.txt'
+    file_path.write_text(text_config, encoding='utf-8')
 
-        yield ConfigLoader.load_from_text(f.name)
-
-        Path(f.name).unlink()
+    return ConfigLoader.load_from_text(file_path)
 
 
 @pytest.fixture
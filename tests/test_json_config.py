@@ -1,20 +1,36 @@
 """JSON 파일 설정 로딩 테스트"""
 
 import json
-import tempfile
+import logging
 from pathlib import Path
+from typing import Any, Dict
 
 import pytest
-
-from sd_tagfilter.config import ConfigLoader, load_config_from_file
-
-
-class TestJsonConfigLoading:
-    """JSON 파일 설정 로딩 테스트"""
-
-    def test_load_simple_json_config(self):
-        """간단한 JSON 설정 로딩 테스트"""
-        config_data = {
+from pydantic import ValidationError
+
+from sd_tagfilter import FilterRule, FilterType, GroupFilterRule, TagFilterEngine, config as config_module
+from sd_tagfilter.config import (
+    ConfigLoader,
+    FilterRuleConfig,
+    FilterRuleRecord,
+    GroupFilterRuleConfig,
+    GroupFilterRuleRecord,
+    InvalidFilterTypeError,
+    NegativePriorityError,
+    TagFilterConfig,
+    _load_unchanged_file,  # pyright: ignore[reportPrivateUsage]
+    clear_config_cache,
+    load_config_from_file,
+)
+from sd_tagfilter.filters import MultiPatternFilter
+
+from .helpers import write_json
+
+# 규칙 종류별 JSON 설정 로딩 케이스: 파일에 쓴 모든 필드가 그대로 로드되어야 함
+LOAD_CASES = [
+    # 간단한 JSON 설정
+    pytest.param(
+        {
             'version': '1.0',
             'global_settings': {'case_sensitive': False, 'default_priority': 50},
             'rules': [
@@ -33,37 +49,12 @@ class TestJsonConfigLoading:
                     'description': '특정 단어 정확히 매칭',
                 },
             ],
-        }
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f, indent=2)
-            f.flush()
-
-            config = ConfigLoader.load_from_json(f.name)
-
-            assert config.version == '1.0'
-            assert len(config.rules) == 2
-            assert config.global_settings['case_sensitive'] is False
-            assert config.global_settings['default_priority'] == 50
-
-            # 첫 번째 규칙 검증
-            assert config.rules[0].filter_type == 'plain_keyword'
-            assert config.rules[0].pattern == 'nsfw'
-            assert config.rules[0].priority == 100
-            assert config.rules[0].enabled is True
-            assert config.rules[0].description == 'NSFW 키워드 제거'
-
-            # 두 번째 규칙 검증
-            assert config.rules[1].filter_type == 'regex'
-            assert config.rules[1].pattern == '\\b(nude|naked)\\b'
-            assert config.rules[1].priority == 90
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_load_group_filter_rules(self):
-        """그룹 필터 규칙 로딩 테스트"""
-        config_data = {
+        },
+        id='simple',
+    ),
+    # 그룹 필터 규칙
+    pytest.param(
+        {
             'version': '1.0',
             'rules': [
                 {
@@ -81,34 +72,12 @@ class TestJsonConfigLoading:
                     'description': '명시적 NSFW 조합 제거 (비활성화)',
                 },
             ],
-        }
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f, indent=2)
-            f.flush()
-
-            config = ConfigLoader.load_from_json(f.name)
-
-            assert len(config.rules) == 2
-
-            # 첫 번째 그룹 규칙
-            assert config.rules[0].filter_type == 'group'
-            assert config.rules[0].patterns == ['steam', 'sweat', 'blush']
-            assert config.rules[0].priority == 100
-            assert config.rules[0].enabled is True
-
-            # 두 번째 그룹 규칙
-            assert config.rules[1].filter_type == 'group'
-            assert config.rules[1].patterns == ['nude', 'naked']
-            assert config.rules[1].priority == 95
-            assert config.rules[1].enabled is False
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_load_replacement_rules(self):
-        """치환 규칙 로딩 테스트"""
-        config_data = {
+        },
+        id='group',
+    ),
+    # 치환 규칙
+    pytest.param(
+        {
             'version': '1.0',
             'rules': [
                 {
@@ -128,34 +97,12 @@ class TestJsonConfigLoading:
                     'description': '_old를 _new로 교체',
                 },
             ],
-        }
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f, indent=2)
-            f.flush()
-
-            config = ConfigLoader.load_from_json(f.name)
-
-            assert len(config.rules) == 2
-
-            # 첫 번째 치환 규칙
-            assert config.rules[0].filter_type == 'replace'
-            assert config.rules[0].pattern == 'bad_word'
-            assert config.rules[0].replacement == 'good_word'
-            assert config.rules[0].priority == 50
-
-            # 두 번째 치환 규칙
-            assert config.rules[1].filter_type == 'replace_capture'
-            assert config.rules[1].pattern == '(.*)_old'
-            assert config.rules[1].replacement == '$1_new'
-            assert config.rules[1].priority == 40
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_load_wildcard_rules(self):
-        """와일드카드 규칙 로딩 테스트"""
-        config_data = {
+        },
+        id='replacement',
+    ),
+    # 와일드카드 규칙
+    pytest.param(
+        {
             'version': '1.0',
             'rules': [
                 {
@@ -173,34 +120,12 @@ class TestJsonConfigLoading:
                     'description': '임시 태그 제거 (비활성화)',
                 },
             ],
-        }
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f, indent=2)
-            f.flush()
-
-            config = ConfigLoader.load_from_json(f.name)
-
-            assert len(config.rules) == 2
-
-            # 첫 번째 와일드카드 규칙
-            assert config.rules[0].filter_type == 'wildcard'
-            assert config.rules[0].pattern == '*_hair'
-            assert config.rules[0].priority == 60
-            assert config.rules[0].enabled is True
-
-            # 두 번째 와일드카드 규칙
-            assert config.rules[1].filter_type == 'wildcard'
-            assert config.rules[1].pattern == 'temp_*'
-            assert config.rules[1].priority == 30
-            assert config.rules[1].enabled is False
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_load_mixed_rules(self):
-        """혼합 규칙 로딩 테스트"""
-        config_data = {
+        },
+        id='wildcard',
+    ),
+    # 혼합 규칙
+    pytest.param(
+        {
             'version': '1.0',
             'global_settings': {'case_sensitive': True, 'max_rules': 50},
             'rules': [
@@ -233,207 +158,373 @@ class TestJsonConfigLoading:
                     'description': '테스트 키워드',
                 },
             ],
-        }
+        },
+        id='mixed',
+    ),
+]
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f, indent=2)
-            f.flush()
 
-            config = ConfigLoader.load_from_json(f.name)
+class TestJsonConfigLoading:
+    """JSON 파일 설정 로딩 테스트"""
 
-            assert config.version == '1.0'
-            assert len(config.rules) == 4
-            assert config.global_settings['case_sensitive'] is True
-            assert config.global_settings['max_rules'] == 50
+    @pytest.mark.parametrize('config_data', LOAD_CASES)
+    def test_load_rules(self, tmp_path: Path, config_data: Dict[str, Any]):
+        """규칙 종류별 JSON 설정 로딩 테스트"""
+        file_path = tmp_path / 'config.json'
+        write_json(file_path, config_data)
 
-            # 규칙 타입별 검증
-            assert config.rules[0].filter_type == 'group'
-            assert config.rules[1].filter_type == 'regex'
-            assert config.rules[2].filter_type == 'wildcard'
-            assert config.rules[3].filter_type == 'plain_keyword'
+        config = ConfigLoader.load_from_json(file_path)
 
-            # 파일 정리
-            Path(f.name).unlink()
+        assert config.version == config_data['version']
+        assert config.global_settings == config_data.get('global_settings', {})
+        assert len(config.rules) == len(config_data['rules'])
+        for rule, expected in zip(config.rules, config_data['rules']):
+            for field, value in expected.items():
+                assert getattr(rule, field) == value, (field, rule)
 
-    def test_load_config_from_file_auto_detect(self):
+    def test_load_config_from_file_auto_detect(self, tmp_path: Path):
         """파일 확장자 자동 감지 테스트"""
         config_data = {
             'version': '1.0',
             'rules': [{'filter_type': 'plain_keyword', 'pattern': 'test', 'priority': 50, 'enabled': True}],
         }
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f, indent=2)
-            f.flush()
-
-            config = load_config_from_file(f.name)
+        file_path = tmp_path / 'config.json'
+        write_json(file_path, config_data)
 
-            assert config.version == '1.0'
-            assert len(config.rules) == 1
-            assert config.rules[0].pattern == 'test'
+        config = load_config_from_file(file_path)
 
-            # 파일 정리
-            Path(f.name).unlink()
+        assert config.version == '1.0'
+        assert len(config.rules) == 1
+        assert config.rules[0].pattern == 'test'
 
-    def test_invalid_json_format(self):
+    def test_invalid_json_format(self, tmp_path: Path):
         """잘못된 JSON 형식 테스트"""
         invalid_json = '{"version": "1.0", "rules": [{'
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write(invalid_json)
-            f.flush()
-
-            with pytest.raises(json.JSONDecodeError):
-                ConfigLoader.load_from_json(f.name)
+        file_path = tmp_path / 'config.json'
+        file_path.write_text(invalid_json, encoding='utf-8')
 
-            # 파일 정리
-            Path(f.name).unlink()
+        with pytest.raises(json.JSONDecodeError):
+            ConfigLoader.load_from_json(file_path)
 
-    def test_invalid_filter_type(self):
+    def test_invalid_filter_type(self, tmp_path: Path):
         """잘못된 필터 타입 테스트"""
         config_data = {'version': '1.0', 'rules': [{'filter_type': 'invalid_type', 'pattern': 'test', 'priority': 50}]}
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f, indent=2)
-            f.flush()
+        file_path = tmp_path / 'config.json'
+        write_json(file_path, config_data)
+
+        with pytest.raises(InvalidFilterTypeError):
+            ConfigLoader.load_from_json(file_path)
+
+    def test_filter_type_coerced_once(self):
+        """필터 타입이 로드 시 열거형으로 변환되어 규칙 변환에 그대로 쓰이는지 확인"""
+        config = TagFilterConfig.model_validate({'rules': [{'filter_type': 'regex', 'pattern': 'test'}]})
+        rule_config = config.rules[0]
+
+        assert rule_config.filter_type is FilterType.REGEX
+        assert config.to_filter_rules()[0].filter_type is FilterType.REGEX
+        assert json.loads(config.model_dump_json())['rules'][0]['filter_type'] == 'regex'
 
-            with pytest.raises(ValueError, match='Invalid filter type'):
-                ConfigLoader.load_from_json(f.name)
+    def test_rule_config_models_keep_pydantic_api(self):
+        """규칙 설정 모델은 BaseModel API를 유지하고, 설정에 넘기면 레코드로 저장되는지 확인"""
+        rule = FilterRuleConfig.model_validate({'filter_type': 'wildcard', 'pattern': '*_hair', 'priority': 5})
+        group = GroupFilterRuleConfig(patterns=['steam', 'sweat'])
 
-            # 파일 정리
-            Path(f.name).unlink()
+        assert rule.model_dump()['filter_type'] is FilterType.WILDCARD
+        assert rule.model_copy(update={'priority': 7}).priority == 7
+        assert 'pattern' in FilterRuleConfig.model_fields
+        assert 'patterns' in GroupFilterRuleConfig.model_json_schema()['properties']
 
-    def test_invalid_priority(self):
+        config = TagFilterConfig.model_validate({'rules': [rule, group]})
+
+        assert isinstance(config.rules[0], FilterRuleRecord)
+        assert isinstance(config.rules[1], GroupFilterRuleRecord)
+        assert config.rules[0].to_filter_rule() == rule.to_filter_rule()
+        assert config.rules[1].to_group_filter_rule() == group.to_group_filter_rule()
+
+    def test_invalid_priority(self, tmp_path: Path):
         """잘못된 우선순위 테스트"""
         config_data = {
             'version': '1.0',
             'rules': [{'filter_type': 'plain_keyword', 'pattern': 'test', 'priority': -10}],
         }
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f, indent=2)
-            f.flush()
-
-            with pytest.raises(ValueError, match='Priority must be non-negative'):
-                ConfigLoader.load_from_json(f.name)
+        file_path = tmp_path / 'config.json'
+        write_json(file_path, config_data)
 
-            # 파일 정리
-            Path(f.name).unlink()
+        with pytest.raises(NegativePriorityError):
+            ConfigLoader.load_from_json(file_path)
 
-    def test_empty_group_patterns(self):
+    def test_empty_group_patterns(self, tmp_path: Path):
         """빈 그룹 패턴 테스트"""
         config_data = {'version': '1.0', 'rules': [{'filter_type': 'group', 'patterns': [], 'priority': 50}]}
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f, indent=2)
-            f.flush()
+        file_path = tmp_path / 'config.json'
+        write_json(file_path, config_data)
 
-            with pytest.raises(ValueError, match='Group filter must have at least one pattern'):
-                ConfigLoader.load_from_json(f.name)
-
-            # 파일 정리
-            Path(f.name).unlink()
+        with pytest.raises(ValueError, match='Group filter must have at least one pattern'):
+            ConfigLoader.load_from_json(file_path)
 
     def test_file_not_found(self):
         """파일이 존재하지 않는 경우 테스트"""
         with pytest.raises(FileNotFoundError):
             ConfigLoader.load_from_json('nonexistent_file.json')
 
-    def test_get_enabled_rules(self):
+    def test_get_enabled_rules(self, sample_config: TagFilterConfig):
         """활성화된 규칙만 가져오기 테스트"""
-        config_data = {
-            'version': '1.0',
-            'rules': [
-                {'filter_type': 'plain_keyword', 'pattern': 'enabled_rule', 'priority': 50, 'enabled': True},
-                {'filter_type': 'plain_keyword', 'pattern': 'disabled_rule', 'priority': 40, 'enabled': False},
-                {'filter_type': 'regex', 'pattern': '\\btest\\b', 'priority': 30, 'enabled': True},
-            ],
-        }
+        enabled_rules = sample_config.get_enabled_rules()
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f, indent=2)
-            f.flush()
+        assert [rule.enabled for rule in enabled_rules] == [True, True, True]
+        assert enabled_rules[0].pattern == 'enabled_rule'
+        assert enabled_rules[1].pattern == '\\btest\\b'
+        assert isinstance(enabled_rules[2], GroupFilterRuleRecord)
 
-            config = ConfigLoader.load_from_json(f.name)
-            enabled_rules = config.get_enabled_rules()
+    def test_get_rules_by_priority(self, sample_config: TagFilterConfig):
+        """우선순위 순으로 정렬된 규칙 가져오기 테스트"""
+        sorted_rules = sample_config.get_rules_by_priority()
 
-            assert len(enabled_rules) == 2
-            assert enabled_rules[0].pattern == 'enabled_rule'
-            assert enabled_rules[1].pattern == '\\btest\\b'
+        assert [rule.priority for rule in sorted_rules] == [60, 50, 40, 30]
+        assert sorted_rules[1].pattern == 'enabled_rule'
+        assert sorted_rules[2].pattern == 'disabled_rule'
+        assert sorted_rules[3].pattern == '\\btest\\b'
 
-            # 파일 정리
-            Path(f.name).unlink()
+    def test_to_filter_rules_conversion(self, sample_config: TagFilterConfig):
+        """FilterRule 객체로 변환 테스트"""
+        filter_rules = sample_config.to_filter_rules()
 
-    def test_get_rules_by_priority(self):
-        """우선순위 순으로 정렬된 규칙 가져오기 테스트"""
+        assert len(filter_rules) == 4
+
+        # 키워드/정규식 규칙은 FilterRule
+        assert isinstance(filter_rules[0], FilterRule)
+        assert filter_rules[0].pattern == 'enabled_rule'
+        assert filter_rules[0].description == '테스트 규칙'
+        assert isinstance(filter_rules[2], FilterRule)
+        assert filter_rules[2].filter_type == FilterType.REGEX
+
+        # 그룹 규칙은 GroupFilterRule
+        assert isinstance(filter_rules[3], GroupFilterRule)
+        assert filter_rules[3].patterns == ('a', 'b')
+
+    def test_loaded_filter_types_are_shared(self, tmp_path: Path):
+        """규칙마다 파싱된 필터 타입 문자열이 하나의 객체(열거형 또는 상수)로 합쳐지는지 확인"""
         config_data = {
-            'version': '1.0',
             'rules': [
-                {'filter_type': 'plain_keyword', 'pattern': 'low_priority', 'priority': 10, 'enabled': True},
-                {'filter_type': 'plain_keyword', 'pattern': 'high_priority', 'priority': 100, 'enabled': True},
-                {'filter_type': 'regex', 'pattern': 'medium_priority', 'priority': 50, 'enabled': True},
-            ],
+                {'filter_type': 'plain_keyword', 'pattern': 'nsfw'},
+                {'filter_type': 'plain_keyword', 'pattern': 'gore'},
+                {'filter_type': 'group', 'patterns': ['a', 'b']},
+                {'filter_type': 'group', 'patterns': ['c', 'd']},
+            ]
         }
+        file_path = tmp_path / 'config.json'
+        write_json(file_path, config_data)
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f, indent=2)
-            f.flush()
+        rules = ConfigLoader.load_from_json(file_path).rules
 
-            config = ConfigLoader.load_from_json(f.name)
-            sorted_rules = config.get_rules_by_priority()
+        assert rules[0].filter_type is rules[1].filter_type is FilterType.PLAIN_KEYWORD
+        assert rules[2].filter_type is rules[3].filter_type
 
-            assert len(sorted_rules) == 3
-            assert sorted_rules[0].pattern == 'high_priority'
-            assert sorted_rules[0].priority == 100
-            assert sorted_rules[1].pattern == 'medium_priority'
-            assert sorted_rules[1].priority == 50
-            assert sorted_rules[2].pattern == 'low_priority'
-            assert sorted_rules[2].priority == 10
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_to_filter_rules_conversion(self):
-        """FilterRule 객체로 변환 테스트"""
+    def test_loaded_keywords_share_one_stage(self, tmp_path: Path):
+        """설정에서 읽은 플레인 키워드 규칙들이 엔진에서 하나의 검색 단계로 합쳐지는지 확인"""
+        keywords = [f'kw{i}' for i in range(30)]
         config_data = {
             'version': '1.0',
             'rules': [
-                {
-                    'filter_type': 'plain_keyword',
-                    'pattern': 'test',
-                    'priority': 50,
-                    'enabled': True,
-                    'description': '테스트 규칙',
-                },
-                {
-                    'filter_type': 'group',
-                    'patterns': ['a', 'b'],
-                    'priority': 60,
-                    'enabled': True,
-                    'description': '그룹 규칙',
-                },
+                {'filter_type': 'plain_keyword', 'pattern': keyword, 'priority': i % 3}
+                for i, keyword in enumerate(keywords)
             ],
         }
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f, indent=2)
-            f.flush()
-
-            config = ConfigLoader.load_from_json(f.name)
-            filter_rules = config.to_filter_rules()
-
-            assert len(filter_rules) == 2
-
-            # 첫 번째 규칙은 FilterRule
-            from sd_tagfilter.base import FilterRule
-
-            assert isinstance(filter_rules[0], FilterRule)
-            assert filter_rules[0].pattern == 'test'
-
-            # 두 번째 규칙은 GroupFilterRule
-            from sd_tagfilter.base import GroupFilterRule
-
-            assert isinstance(filter_rules[1], GroupFilterRule)
-
-            # 파일 정리
-            Path(f.name).unlink()
+        file_path = tmp_path / 'config.json'
+        write_json(file_path, config_data)
+
+        engine = TagFilterEngine(ConfigLoader.load_from_json(file_path).to_filter_rules())
+
+        assert len(engine._pipeline) == 1  # pyright: ignore[reportPrivateUsage]
+        assert isinstance(engine._pipeline[0], MultiPatternFilter)  # pyright: ignore[reportPrivateUsage]
+        assert engine.filter_tags(['KW7 tag', 'long_hair', 'kw29']) == ['long_hair']
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_invalid_json_error_type(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool):
+        """JSON 파서와 관계없이 파싱 오류는 json.JSONDecodeError로 잡히는지 확인"""
+        if use_orjson:
+            pytest.importorskip('orjson')
+        else:
+            monkeypatch.setattr(config_module, 'orjson', None)
+
+        file_path = tmp_path / 'broken.json'
+        file_path.write_text('{"version": "1.0", "rules": [', encoding='utf-8')
+
+        with pytest.raises(json.JSONDecodeError):
+            ConfigLoader.load_from_json(file_path)
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path: Path):
+        """바뀌지 않은 파일은 다시 파싱하지 않고, 반환된 설정을 수정해도 캐시에 영향이 없는지 확인"""
+        clear_config_cache()
+        file_path = tmp_path / 'config.json'
+        write_json(
+            file_path,
+            {
+                'rules': [
+                    {'filter_type': 'plain_keyword', 'pattern': 'nsfw'},
+                    {'filter_type': 'group', 'patterns': ['steam', 'sweat']},
+                ]
+            },
+        )
+
+        first = ConfigLoader.load_from_json(file_path)
+        rule, group = first.rules
+        assert isinstance(rule, FilterRuleRecord) and isinstance(group, GroupFilterRuleRecord)
+        rule.enabled = False
+        rule.pattern = 'other'
+        group.patterns.append('blush')
+        first.global_settings['changed'] = True
+
+        second = ConfigLoader.load_from_json(file_path)
+        assert second.to_filter_rules() == [
+            FilterRule(filter_type=FilterType.PLAIN_KEYWORD, pattern='nsfw'),
+            GroupFilterRule.from_list(patterns=['steam', 'sweat']),
+        ]
+        assert second.global_settings == {}
+        assert _load_unchanged_file.cache_info().hits == 1
+
+        second.rules.clear()
+        assert len(ConfigLoader.load_from_json(file_path).rules) == 2
+        assert _load_unchanged_file.cache_info().hits == 2
+
+        # 크기가 바뀌면 다시 파싱
+        write_json(file_path, {'rules': [{'filter_type': 'plain_keyword', 'pattern': 'explicit'}]})
+        assert [rule.pattern for rule in ConfigLoader.load_from_json(file_path).rules] == ['explicit']
+        assert _load_unchanged_file.cache_info().misses == 2
+
+        clear_config_cache()
+        assert _load_unchanged_file.cache_info().currsize == 0
+
+    def test_disk_cache_skips_parsing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ):
+        """새 프로세스처럼 메모리 캐시가 비어도 디스크 캐시로 파싱 없이 로드하고, 원본이 바뀌면 다시 파싱하는지 확인"""
+        file_path = tmp_path / 'config.json'
+        cache_path = tmp_path / 'config.json.cache'
+        write_json(file_path, {'rules': [{'filter_type': 'plain_keyword', 'pattern': 'nsfw'}]})
+
+        clear_config_cache()
+        expected = ConfigLoader.load_cached(file_path)
+        assert cache_path.exists()
+
+        def fail_read(file_path: Path) -> None:
+            raise AssertionError('config file parsed again')
+
+        with monkeypatch.context() as patch:
+            patch.setattr(ConfigLoader, '_read_json_file', fail_read)
+            clear_config_cache()
+            assert ConfigLoader.load_cached(file_path) == expected
+
+        # 원본이 바뀌거나 캐시가 손상되면 원본을 다시 파싱
+        write_json(file_path, {'rules': [{'filter_type': 'plain_keyword', 'pattern': 'gore_tag'}]})
+        clear_config_cache()
+        assert [rule.pattern for rule in ConfigLoader.load_cached(file_path).rules] == ['gore_tag']
+
+        for broken in (b'broken', cache_path.read_bytes()[:-8]):
+            cache_path.write_bytes(broken)
+            clear_config_cache()
+            with caplog.at_level(logging.DEBUG, logger='sd_tagfilter.config'):
+                assert [rule.pattern for rule in ConfigLoader.load_cached(file_path).rules] == ['gore_tag']
+            assert 'Ignoring disk cache' in caplog.text
+            caplog.clear()
+        clear_config_cache()
+
+    @pytest.mark.parametrize('config_data', LOAD_CASES)
+    def test_streaming_load_matches_load(self, tmp_path: Path, config_data: Dict[str, Any]):
+        """스트리밍 로드가 일반 로드와 같은 설정을 만드는지 확인"""
+        pytest.importorskip('ijson')
+        file_path = tmp_path / 'config.json'
+        write_json(file_path, config_data)
+
+        assert ConfigLoader.load_from_json_streaming(file_path) == ConfigLoader.load_from_json(file_path)
+
+    def test_streaming_load_errors(self, tmp_path: Path):
+        """스트리밍 로드도 일반 로드와 같은 종류의 오류를 내는지 확인"""
+        pytest.importorskip('ijson')
+        file_path = tmp_path / 'config.json'
+
+        file_path.write_text('{"version": "1.0", "rules": [{"filter_type": "regex", "pattern": "a"}', encoding='utf-8')
+        with pytest.raises(json.JSONDecodeError):
+            ConfigLoader.load_from_json_streaming(file_path)
+
+        file_path.write_text('{"rules": [{"filter_type": "invalid_type", "pattern": "a"}]}', encoding='utf-8')
+        with pytest.raises(InvalidFilterTypeError):
+            ConfigLoader.load_from_json_streaming(file_path)
+
+        # 오류 위치에 문제가 된 규칙의 번호가 일반 로드와 같은 형식으로 들어감
+        write_json(
+            file_path,
+            {
+                'rules': [
+                    {'filter_type': 'regex', 'pattern': 'a'},
+                    {'filter_type': 'regex', 'pattern': 'b', 'priority': 'x'},
+                ]
+            },
+        )
+        with pytest.raises(ValidationError) as streaming_error:
+            ConfigLoader.load_from_json_streaming(file_path)
+        with pytest.raises(ValidationError) as load_error:
+            ConfigLoader.load_from_json(file_path)
+        assert streaming_error.value.errors() == load_error.value.errors()
+        assert 'rules.1.rule.priority' in str(streaming_error.value)
+
+        # 규칙 목록이 배열이 아니면 일반 검증 오류를 그대로 보고
+        file_path.write_text('{"version": "1.0", "rules": null}', encoding='utf-8')
+        with pytest.raises(ValueError, match='rules'):
+            ConfigLoader.load_from_json_streaming(file_path)
+
+    def test_streaming_load_requires_ijson(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """ijson이 없으면 설치 방법을 알려주는 ImportError가 발생하는지 확인"""
+        monkeypatch.setattr(config_module, 'ijson', None)
+        file_path = tmp_path / 'config.json'
+        file_path.write_text('{"rules": []}', encoding='utf-8')
+
+        with pytest.raises(ImportError, match='ijson is required'):
+            ConfigLoader.load_from_json_streaming(file_path)
+
+    def test_large_file_is_memory_mapped(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """메모리 맵으로 읽은 큰 파일도 일반 로딩과 같은 결과와 파싱 오류를 내는지 확인"""
+        pytest.importorskip('orjson')
+        file_path = tmp_path / 'config.json'
+        write_json(file_path, {'rules': [{'filter_type': 'plain_keyword', 'pattern': '태그', 'priority': 50}]})
+        expected = ConfigLoader._read_json_file(file_path)  # pyright: ignore[reportPrivateUsage]
+
+        monkeypatch.setattr(config_module, '_MMAP_MIN_SIZE', 1)
+        assert ConfigLoader._read_json_file(file_path) == expected  # pyright: ignore[reportPrivateUsage]
+
+        file_path.write_text('{"rules": [', encoding='utf-8')
+        with pytest.raises(json.JSONDecodeError):
+            ConfigLoader._read_json_file(file_path)  # pyright: ignore[reportPrivateUsage]
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_save_and_load_round_trip(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool):
+        """저장한 JSON 설정을 다시 읽으면 같은 설정이 되는지 확인 (orjson 유무와 무관)"""
+        if use_orjson:
+            pytest.importorskip('orjson')
+        else:
+            monkeypatch.setattr(config_module, 'orjson', None)
+
+        config = TagFilterConfig.model_validate(
+            {
+                'version': '1.0',
+                'rules': [
+                    {'filter_type': 'plain_keyword', 'pattern': '태그', 'priority': 50, 'description': '설명'},
+                    {'filter_type': 'group', 'patterns': ['a', 'b'], 'priority': 60},
+                ],
+            }
+        )
+        file_path = tmp_path / 'config.json'
+        ConfigLoader.save_to_json(config, file_path)
+
+        assert '태그' in file_path.read_text(encoding='utf-8')
+        assert json.loads(file_path.read_text(encoding='utf-8')) == config.model_dump(mode='json')
+        assert ConfigLoader.load_from_json(file_path) == config
+
+        file_path.write_text('{"rules": [', encoding='utf-8')
+        with pytest.raises(json.JSONDecodeError):
+            ConfigLoader.load_from_json(file_path)
@@ -0,0 +1,175 @@
+"""
+패턴 매칭 유틸리티 테스트
+"""
+
+import random
+import re
+
+import pytest
+
+from sd_tagfilter.patterns import (
+    PatternCache,
+    clear_pattern_cache,
+    compile_pattern,
+    compile_substitution,
+    compile_wildcard_matcher,
+    create_case_insensitive_pattern,
+    is_regex_pattern,
+    match_with_wildcards,
+    parse_replacement_pattern,
+    substitute_with_capture,
+    validate_regex_pattern,
+    wildcard_to_regex,
+)
+
+
+class TestPatternCache:
+    """PatternCache 테스트"""
+
+    def test_cache_returns_same_pattern(self):
+        """같은 패턴과 플래그는 캐싱된 객체를 반환하는지 확인"""
+        with pytest.deprecated_call():
+            cache = PatternCache()
+        pattern = cache.get_compiled_pattern('a.*b')
+
+        assert pattern.search('axxb')
+        assert cache.get_compiled_pattern('a.*b') is pattern
+        assert cache.get_compiled_pattern('a.*b', re.IGNORECASE).flags & re.IGNORECASE
+
+    def test_clear_cache_keeps_shared_cache(self):
+        """기본 인스턴스의 캐시 초기화가 모듈 공유 캐시를 비우지 않는지 확인"""
+        pattern = compile_pattern('shared.*')
+        with pytest.deprecated_call():
+            cache = PatternCache()
+        cache.get_compiled_pattern('shared.*')
+        cache.clear_cache()
+
+        assert cache.get_compiled_pattern.cache_info().maxsize == 1000
+        assert compile_pattern('shared.*') is pattern
+        clear_pattern_cache()
+        assert compile_pattern.cache_info().currsize == 0
+
+    def test_cache_honors_max_size(self):
+        """크기를 지정하면 그 크기의 별도 캐시를 사용하는지 확인"""
+        with pytest.deprecated_call():
+            small = PatternCache(max_size=2)
+        for pattern in ('a', 'b', 'c'):
+            small.get_compiled_pattern(pattern)
+
+        assert small.get_compiled_pattern.cache_info().maxsize == 2
+        assert small.get_compiled_pattern.cache_info().currsize == 2
+        with pytest.deprecated_call():
+            assert PatternCache(max_size=2).get_compiled_pattern.cache_info().currsize == 0
+
+    def test_clear_cache(self):
+        """캐시 초기화 확인"""
+        with pytest.deprecated_call():
+            cache = PatternCache(max_size=10)
+        cache.get_compiled_pattern('a')
+        cache.clear_cache()
+
+        assert cache.get_compiled_pattern.cache_info().currsize == 0
+
+
+class TestParseReplacementPattern:
+    """parse_replacement_pattern 테스트"""
+
+    def test_splits_on_first_separator(self):
+        """첫 번째 || 기준으로 나누고 양쪽 공백을 제거하는지 확인"""
+        assert parse_replacement_pattern(' red_hair || blue_hair ') == ('red_hair', 'blue_hair')
+        assert parse_replacement_pattern('a||b||c') == ('a', 'b||c')
+        assert parse_replacement_pattern('a||') == ('a', '')
+
+    def test_missing_separator(self):
+        """구분자가 없으면 ValueError 발생"""
+        with pytest.raises(ValueError, match='Invalid replacement pattern'):
+            parse_replacement_pattern('red_hair|blue_hair')
+
+
+class TestValidateRegexPattern:
+    """validate_regex_pattern 테스트"""
+
+    def test_valid_pattern_is_cached(self):
+        """검증에 성공한 패턴은 공유 캐시에 남는지 확인"""
+        clear_pattern_cache()
+
+        assert validate_regex_pattern(r'(\w+)_validated')
+        assert compile_pattern.cache_info().currsize == 1
+        assert not validate_regex_pattern('(unclosed')
+
+
+class TestIsRegexPattern:
+    """is_regex_pattern 테스트"""
+
+    def test_special_chars(self):
+        """정규식 특수문자가 하나라도 있으면 정규식으로 판별하는지 확인"""
+        assert not is_regex_pattern('simple_tag')
+        assert not is_regex_pattern('')
+        for char in r'.*+?^${}[]|()':
+            assert is_regex_pattern(f'tag{char}')
+
+
+class TestWildcardMatching:
+    """와일드카드 매칭과 캡처 치환 테스트"""
+
+    def test_wildcard_to_regex(self):
+        """와일드카드를 이스케이프된 정규식으로 변환하는지 확인"""
+        assert wildcard_to_regex('*_hair') == '.*_hair'
+        assert wildcard_to_regex('long hair (1)') == r'long\ hair\ \(1\)'
+        assert wildcard_to_regex('blue-?eyes') == 'blue-?eyes'
+        assert wildcard_to_regex('a?') == r'a\?'
+
+    def test_helpers_use_precompiled_patterns(self, monkeypatch: pytest.MonkeyPatch):
+        """변환/판별 함수가 re 모듈 함수 대신 모듈 상수 패턴을 사용하는지 확인"""
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError('module-level re function called')
+
+        for name in ('sub', 'search', 'match', 'fullmatch'):
+            monkeypatch.setattr(re, name, fail)
+
+        assert wildcard_to_regex('blue-?eyes_*') == 'blue-?eyes_.*'
+        assert is_regex_pattern('a.b')
+        assert compile_substitution(r'(\w+)_tag', '$1')[1] == r'\g<1>'
+
+    def test_match_with_wildcards_case(self):
+        """대소문자 구분 여부마다 따로 컴파일하여 매칭하는지 확인"""
+        assert match_with_wildcards('red_hair', '*_hair')
+        assert not match_with_wildcards('Red_HAIR', '*_hair')
+        assert match_with_wildcards('Red_HAIR', '*_hair', case_sensitive=False)
+        assert not match_with_wildcards('red_hair_x', '*_hair', case_sensitive=False)
+
+    def test_create_case_insensitive_pattern_is_deprecated(self):
+        """인라인 (?i) 패턴 생성 함수가 사용 중단 경고를 내는지 확인"""
+        with pytest.deprecated_call():
+            assert create_case_insensitive_pattern('abc') == '(?i)abc'
+
+    def test_wildcard_matcher_matches_like_regex(self):
+        """리터럴 형태는 str 메서드로, 그 외는 정규식으로 같은 판정을 하는지 확인"""
+        assert not isinstance(compile_wildcard_matcher('*_hair'), re.Pattern)
+        rng = random.Random(0)
+        for _ in range(500):
+            pattern = ''.join(rng.choice('ab_*?\\') for _ in range(rng.randint(0, 5)))
+            try:
+                regex = re.compile(wildcard_to_regex(pattern))
+            except re.error:
+                # 역슬래시 뒤의 ?처럼 변환 결과가 정규식이 아닌 패턴은 비교 대상이 아님
+                continue
+            matcher = compile_wildcard_matcher(pattern)
+            for _ in range(5):
+                text = ''.join(rng.choice('ab_.\\') for _ in range(rng.randint(0, 5)))
+                assert bool(matcher(text)) == bool(regex.fullmatch(text)), (pattern, text)
+
+    def test_substitute_with_capture(self):
+        """같은 패턴으로 반복 치환해도 결과가 같은지 확인"""
+        assert substitute_with_capture('red_hair', r'(.*)_hair', '$1_bald') == 'red_bald'
+        assert substitute_with_capture('blue_hair', r'(.*)_hair', '$1_bald') == 'blue_bald'
+        assert substitute_with_capture('blue_eyes', r'(.*)_hair', '$1_bald') == 'blue_eyes'
+
+    def test_compile_substitution_translates_only_references(self):
+        """$숫자 참조만 변환하고 리터럴 $와 Python 형식 참조는 유지하는지 확인"""
+        pattern, replacement = compile_substitution(r'(\w+)_(\w+)', r'$2 $ \1 $12')
+
+        assert replacement == r'\g<2> $ \1 \g<12>'
+        assert compile_substitution(r'(\w+)_(\w+)', r'$2 $ \1 $12')[0] is pattern
+        assert substitute_with_capture('price_tag', r'(\w+)_tag', '$$1') == '$price'
@@ -1,81 +1,68 @@
 """텍스트 파일 설정 로딩 테스트"""
 
-import tempfile
 from pathlib import Path
 
 import pytest
 
-from sd_tagfilter.config import ConfigLoader, load_config_from_file
+from sd_tagfilter.config import ConfigLoader, NegativePriorityError, load_config_from_file
 
 
 class TestTextConfigLoading:
     """텍스트 파일 설정 로딩 테스트"""
 
-    def test_load_simple_keywords(self):
+    def test_load_simple_keywords(self, tmp_path: Path):
         """간단한 키워드 로딩 테스트"""
         content = """# 테스트 필터 규칙
 nsfw
 adult
 explicit
 """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(content)
-            f.flush()
+        file_path = tmp_path / 'config.txt'
+        file_path.write_text(content, encoding='utf-8')
 
-            config = ConfigLoader.load_from_text(f.name)
+        config = ConfigLoader.load_from_text(file_path)
 
-            assert len(config.rules) == 3
-            assert config.rules[0].filter_type == 'plain_keyword'
-            assert config.rules[0].pattern == 'nsfw'
-            assert config.rules[1].pattern == 'adult'
-            assert config.rules[2].pattern == 'explicit'
+        assert len(config.rules) == 3
+        assert config.rules[0].filter_type == 'plain_keyword'
+        assert config.rules[0].pattern == 'nsfw'
+        assert config.rules[1].pattern == 'adult'
+        assert config.rules[2].pattern == 'explicit'
 
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_load_regex_patterns(self):
+    def test_load_regex_patterns(self, tmp_path: Path):
         """정규식 패턴 로딩 테스트"""
         content = """/\\b(nude|naked)\\b/
 /\\d{4}_\\d{2}_\\d{2}/
 """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(content)
-            f.flush()
-
-            config = ConfigLoader.load_from_text(f.name)
+        file_path = tmp_path / 'config.txt'
+        file_path.write_text(content, encoding='utf-8')
 
-            assert len(config.rules) == 2
-            assert config.rules[0].filter_type == 'regex'
-            assert config.rules[0].pattern == '\\b(nude|naked)\\b'
-            assert config.rules[1].filter_type == 'regex'
-            assert config.rules[1].pattern == '\\d{4}_\\d{2}_\\d{2}'
+        config = ConfigLoader.load_from_text(file_path)
 
-            # 파일 정리
-            Path(f.name).unlink()
+        assert len(config.rules) == 2
+        assert config.rules[0].filter_type == 'regex'
+        assert config.rules[0].pattern == '\\b(nude|naked)\\b'
+        assert config.rules[1].filter_type == 'regex'
+        assert config.rules[1].pattern == '\\d{4}_\\d{2}_\\d{2}'
 
-    def test_load_replacement_patterns(self):
+    def test_load_replacement_patterns(self, tmp_path: Path):
         """치환 패턴 로딩 테스트"""
         content = """bad_word||good_word
 inappropriate||appropriate
 old_style||new_style
 """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(content)
-            f.flush()
-
-            config = ConfigLoader.load_from_text(f.name)
+        file_path = tmp_path / 'config.txt'
+        file_path.write_text(content, encoding='utf-8')
 
-            assert len(config.rules) == 3
-            assert config.rules[0].filter_type == 'replace'
-            assert config.rules[0].pattern == 'bad_word'
-            assert config.rules[0].replacement == 'good_word'
-            assert config.rules[1].pattern == 'inappropriate'
-            assert config.rules[1].replacement == 'appropriate'
+        config = ConfigLoader.load_from_text(file_path)
 
-            # 파일 정리
-            Path(f.name).unlink()
+        assert len(config.rules) == 3
+        assert config.rules[0].filter_type == 'replace'
+        assert config.rules[0].pattern == 'bad_word'
+        assert config.rules[0].replacement == 'good_word'
+        assert config.rules[1].pattern == 'inappropriate'
+        assert config.rules[1].replacement == 'appropriate'
 
-    def test_load_mixed_patterns(self):
+    def test_load_mixed_patterns(self, tmp_path: Path):
         """혼합 패턴 로딩 테스트"""
         content = """# 혼합 패턴 테스트
 nsfw
@@ -85,36 +72,32 @@ adult
 /\\d{4}_\\d{2}_\\d{2}/
 inappropriate||appropriate
 """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(content)
-            f.flush()
+        file_path = tmp_path / 'config.txt'
+        file_path.write_text(content, encoding='utf-8')
 
-            config = ConfigLoader.load_from_text(f.name, default_priority=100)
+        config = ConfigLoader.load_from_text(file_path, default_priority=100)
 
-            assert len(config.rules) == 6
+        assert len(config.rules) == 6
 
-            # 첫 번째 규칙: plain keyword
-            assert config.rules[0].filter_type == 'plain_keyword'
-            assert config.rules[0].pattern == 'nsfw'
-            assert config.rules[0].priority == 100
+        # 첫 번째 규칙: plain keyword
+        assert config.rules[0].filter_type == 'plain_keyword'
+        assert config.rules[0].pattern == 'nsfw'
+        assert config.rules[0].priority == 100
 
-            # 두 번째 규칙: regex
-            assert config.rules[1].filter_type == 'regex'
-            assert config.rules[1].pattern == '\\b(nude|naked)\\b'
+        # 두 번째 규칙: regex
+        assert config.rules[1].filter_type == 'regex'
+        assert config.rules[1].pattern == '\\b(nude|naked)\\b'
 
-            # 세 번째 규칙: replace
-            assert config.rules[2].filter_type == 'replace'
-            assert config.rules[2].pattern == 'bad_word'
-            assert config.rules[2].replacement == 'good_word'
+        # 세 번째 규칙: replace
+        assert config.rules[2].filter_type == 'replace'
+        assert config.rules[2].pattern == 'bad_word'
+        assert config.rules[2].replacement == 'good_word'
 
-            # 글로벌 설정 확인
-            assert config.global_settings['source'] == 'text_file'
-            assert config.global_settings['default_priority'] == 100
+        # 글로벌 설정 확인
+        assert config.global_settings['source'] == 'text_file'
+        assert config.global_settings['default_priority'] == 100
 
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_ignore_comments_and_empty_lines(self):
+    def test_ignore_comments_and_empty_lines(self, tmp_path: Path):
         """주석과 빈 줄 무시 테스트"""
         content = """# 이것은 주석입니다
 
@@ -125,90 +108,90 @@ adult
 # 마지막 주석
 explicit
 """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(content)
-            f.flush()
-
-            config = ConfigLoader.load_from_text(f.name)
+        file_path = tmp_path / 'config.txt'
+        file_path.write_text(content, encoding='utf-8')
 
-            assert len(config.rules) == 3
-            assert config.rules[0].pattern == 'nsfw'
-            assert config.rules[1].pattern == 'adult'
-            assert config.rules[2].pattern == 'explicit'
+        config = ConfigLoader.load_from_text(file_path)
 
-            # 파일 정리
-            Path(f.name).unlink()
+        assert len(config.rules) == 3
+        assert config.rules[0].pattern == 'nsfw'
+        assert config.rules[1].pattern == 'adult'
+        assert config.rules[2].pattern == 'explicit'
 
-    def test_load_config_from_file_auto_detect(self):
+    def test_load_config_from_file_auto_detect(self, tmp_path: Path):
         """파일 확장자 자동 감지 테스트"""
         content = """nsfw
 adult
 explicit
 """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(content)
-            f.flush()
-
-            config = load_config_from_file(f.name, default_priority=75)
+        file_path = tmp_path / 'config.txt'
+        file_path.write_text(content, encoding='utf-8')
 
-            assert len(config.rules) == 3
-            assert config.rules[0].priority == 75
-            assert config.global_settings['default_priority'] == 75
+        config = load_config_from_file(file_path, default_priority=75)
 
-            # 파일 정리
-            Path(f.name).unlink()
+        assert len(config.rules) == 3
+        assert config.rules[0].priority == 75
+        assert config.global_settings['default_priority'] == 75
 
-    def test_invalid_replacement_format(self):
+    def test_invalid_replacement_format(self, tmp_path: Path):
         """잘못된 치환 형식 테스트"""
         content = """bad_word||
 ||good_word
 bad||word||good
 """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(content)
-            f.flush()
+        file_path = tmp_path / 'config.txt'
+        file_path.write_text(content, encoding='utf-8')
 
-            with pytest.raises(ValueError, match='Line 1'):
-                ConfigLoader.load_from_text(f.name)
+        with pytest.raises(ValueError, match='Line 1'):
+            ConfigLoader.load_from_text(file_path)
 
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_empty_regex_pattern(self):
+    def test_empty_regex_pattern(self, tmp_path: Path):
         """빈 정규식 패턴 테스트"""
         content = """//
 /valid_pattern/
 """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(content)
-            f.flush()
+        file_path = tmp_path / 'config.txt'
+        file_path.write_text(content, encoding='utf-8')
+
+        with pytest.raises(ValueError, match='Line 1'):
+            ConfigLoader.load_from_text(file_path)
+
+    def test_line_numbers_follow_file_lines(self, tmp_path: Path):
+        """CRLF 줄바꿈과 줄 안의 특수 공백 문자가 있어도 파일의 줄 단위로 나누는지 확인"""
+        file_path = tmp_path / 'rules.txt'
+        file_path.write_bytes('long\u2028hair\r\nnsfw\r\n//\r\n'.encode())
 
-            with pytest.raises(ValueError, match='Line 1'):
-                ConfigLoader.load_from_text(f.name)
+        with pytest.raises(ValueError, match='Line 3'):
+            ConfigLoader.load_from_text(file_path)
 
-            # 파일 정리
-            Path(f.name).unlink()
+        file_path.write_bytes('long\u2028hair\r\nnsfw\r\n'.encode())
+        config = ConfigLoader.load_from_text(file_path)
+        assert [rule.pattern for rule in config.rules] == ['long\u2028hair', 'nsfw']
+
+    def test_validation_error_reports_line(self, tmp_path: Path):
+        """모든 줄을 한 번에 검증해도 검증 오류에 해당 줄 번호가 붙는지 확인"""
+        file_path = tmp_path / 'rules.txt'
+        file_path.write_text('# 주석\n\nnsfw\n', encoding='utf-8')
+
+        with pytest.raises(NegativePriorityError, match='Line 3: '):
+            ConfigLoader.load_from_text(file_path, default_priority=-1)
 
     def test_file_not_found(self):
         """파일이 존재하지 않는 경우 테스트"""
         with pytest.raises(FileNotFoundError):
             ConfigLoader.load_from_text('nonexistent_file.txt')
 
-    def test_description_generation(self):
+    def test_description_generation(self, tmp_path: Path):
         """설명 자동 생성 테스트"""
         content = """nsfw
 /\\b(nude|naked)\\b/
 bad_word||good_word
 """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(content)
-            f.flush()
-
-            config = ConfigLoader.load_from_text(f.name)
+        file_path = tmp_path / 'config.txt'
+        file_path.write_text(content, encoding='utf-8')
 
-            assert config.rules[0].description == 'Plain keyword: nsfw'
-            assert config.rules[1].description == 'Regex pattern: \\b(nude|naked)\\b'
-            assert config.rules[2].description == 'Replace "bad_word" with "good_word"'
+        config = ConfigLoader.load_from_text(file_path)
 
-            # 파일 정리
-            Path(f.name).unlink()
+        assert config.rules[0].description == 'Plain keyword: nsfw'
+        assert config.rules[1].description == 'Regex pattern: \\b(nude|naked)\\b'
+        assert config.rules[2].description == 'Replace "bad_word" with "good_word"'
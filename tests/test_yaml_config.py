@@ -1,19 +1,44 @@
 """YAML 파일 설정 로딩 테스트"""
 
-import tempfile
+import re
+import subprocess
+import sys
 from pathlib import Path
+from typing import Any, Dict, Optional, Type
 
 import pytest
+import yaml
+
+from sd_tagfilter import FilterRule, GroupFilterRule
+from sd_tagfilter.config import (
+    ConfigLoader,
+    FilterRuleRecord,
+    GroupFilterRuleRecord,
+    InvalidFilterTypeError,
+    NegativePriorityError,
+    TagFilterConfig,
+    _load_yaml_content,  # pyright: ignore[reportPrivateUsage]
+    _UnsupportedYamlFeature,  # pyright: ignore[reportPrivateUsage]
+    _yaml_events_to_data,  # pyright: ignore[reportPrivateUsage]
+    clear_config_cache,
+    load_config_from_file,
+)
+
+# 확장자 자동 감지처럼 내용보다 파일 경로 처리가 중요한 테스트가 함께 쓰는 규칙 하나짜리 설정
+SINGLE_RULE_YAML = """
+version: "1.0"
+rules:
+  - filter_type: "plain_keyword"
+    pattern: "test"
+    priority: 50
+    enabled: true
+"""
 
-from sd_tagfilter.config import ConfigLoader, load_config_from_file
-
-
-class TestYamlConfigLoading:
-    """YAML 파일 설정 로딩 테스트"""
-
-    def test_load_simple_yaml_config(self):
-        """간단한 YAML 설정 로딩 테스트"""
-        yaml_content = """
+# 규칙 종류별 YAML 설정 로딩 케이스: YAML 문서와, 로드된 설정에 그대로 있어야 할 필드
+LOAD_CASES = [
+    # 간단한 YAML 설정
+    pytest.param(
+        """
 version: "1.0"
 global_settings:
   case_sensitive: false
@@ -29,37 +54,25 @@ rules:
     priority: 90
     enabled: true
     description: "특정 단어 정확히 매칭"
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-
-            config = ConfigLoader.load_from_yaml(f.name)
-
-            assert config.version == '1.0'
-            assert len(config.rules) == 2
-            assert config.global_settings['case_sensitive'] is False
-            assert config.global_settings['default_priority'] == 50
-
-            # 첫 번째 규칙 검증
-            assert config.rules[0].filter_type == 'plain_keyword'
-            assert config.rules[0].pattern == 'nsfw'
-            assert config.rules[0].priority == 100
-            assert config.rules[0].enabled is True
-            assert config.rules[0].description == 'NSFW 키워드 제거'
-
-            # 두 번째 규칙 검증
-            assert config.rules[1].filter_type == 'regex'
-            assert config.rules[1].pattern == '\\b(nude|naked)\\b'
-            assert config.rules[1].priority == 90
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_load_group_filter_rules(self):
-        """그룹 필터 규칙 로딩 테스트"""
-        yaml_content = """
+""",
+        {
+            'global_settings': {'case_sensitive': False, 'default_priority': 50},
+            'rules': [
+                {
+                    'filter_type': 'plain_keyword',
+                    'pattern': 'nsfw',
+                    'priority': 100,
+                    'enabled': True,
+                    'description': 'NSFW 키워드 제거',
+                },
+                {'filter_type': 'regex', 'pattern': '\\b(nude|naked)\\b', 'priority': 90},
+            ],
+        },
+        id='simple',
+    ),
+    # 그룹 필터 규칙
+    pytest.param(
+        """
 version: "1.0"
 rules:
   - filter_type: "group"
@@ -77,34 +90,18 @@ rules:
     priority: 95
     enabled: false
     description: "명시적 NSFW 조합 제거 (비활성화)"
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-
-            config = ConfigLoader.load_from_yaml(f.name)
-
-            assert len(config.rules) == 2
-
-            # 첫 번째 그룹 규칙
-            assert config.rules[0].filter_type == 'group'
-            assert config.rules[0].patterns == ['steam', 'sweat', 'blush']
-            assert config.rules[0].priority == 100
-            assert config.rules[0].enabled is True
-
-            # 두 번째 그룹 규칙
-            assert config.rules[1].filter_type == 'group'
-            assert config.rules[1].patterns == ['nude', 'naked']
-            assert config.rules[1].priority == 95
-            assert config.rules[1].enabled is False
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_load_replacement_rules(self):
-        """치환 규칙 로딩 테스트"""
-        yaml_content = """
+""",
+        {
+            'rules': [
+                {'filter_type': 'group', 'patterns': ['steam', 'sweat', 'blush'], 'priority': 100, 'enabled': True},
+                {'filter_type': 'group', 'patterns': ['nude', 'naked'], 'priority': 95, 'enabled': False},
+            ],
+        },
+        id='group',
+    ),
+    # 치환 규칙
+    pytest.param(
+        """
 version: "1.0"
 rules:
   - filter_type: "replace"
@@ -119,34 +116,18 @@ rules:
     priority: 40
     enabled: true
     description: "_old를 _new로 교체"
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-
-            config = ConfigLoader.load_from_yaml(f.name)
-
-            assert len(config.rules) == 2
-
-            # 첫 번째 치환 규칙
-            assert config.rules[0].filter_type == 'replace'
-            assert config.rules[0].pattern == 'bad_word'
-            assert config.rules[0].replacement == 'good_word'
-            assert config.rules[0].priority == 50
-
-            # 두 번째 치환 규칙
-            assert config.rules[1].filter_type == 'replace_capture'
-            assert config.rules[1].pattern == '(.*)_old'
-            assert config.rules[1].replacement == '$1_new'
-            assert config.rules[1].priority == 40
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_load_wildcard_rules(self):
-        """와일드카드 규칙 로딩 테스트"""
-        yaml_content = """
+""",
+        {
+            'rules': [
+                {'filter_type': 'replace', 'pattern': 'bad_word', 'replacement': 'good_word', 'priority': 50},
+                {'filter_type': 'replace_capture', 'pattern': '(.*)_old', 'replacement': '$1_new', 'priority': 40},
+            ],
+        },
+        id='replacement',
+    ),
+    # 와일드카드 규칙
+    pytest.param(
+        """
 version: "1.0"
 rules:
   - filter_type: "wildcard"
@@ -159,34 +140,18 @@ rules:
     priority: 30
     enabled: false
     description: "임시 태그 제거 (비활성화)"
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-
-            config = ConfigLoader.load_from_yaml(f.name)
-
-            assert len(config.rules) == 2
-
-            # 첫 번째 와일드카드 규칙
-            assert config.rules[0].filter_type == 'wildcard'
-            assert config.rules[0].pattern == '*_hair'
-            assert config.rules[0].priority == 60
-            assert config.rules[0].enabled is True
-
-            # 두 번째 와일드카드 규칙
-            assert config.rules[1].filter_type == 'wildcard'
-            assert config.rules[1].pattern == 'temp_*'
-            assert config.rules[1].priority == 30
-            assert config.rules[1].enabled is False
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_load_mixed_rules(self):
-        """혼합 규칙 로딩 테스트"""
-        yaml_content = """
+""",
+        {
+            'rules': [
+                {'filter_type': 'wildcard', 'pattern': '*_hair', 'priority': 60, 'enabled': True},
+                {'filter_type': 'wildcard', 'pattern': 'temp_*', 'priority': 30, 'enabled': False},
+            ],
+        },
+        id='wildcard',
+    ),
+    # 혼합 규칙
+    pytest.param(
+        """
 version: "1.0"
 global_settings:
   case_sensitive: true
@@ -214,164 +179,176 @@ rules:
     priority: 40
     enabled: true
     description: "테스트 키워드"
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-
-            config = ConfigLoader.load_from_yaml(f.name)
-
-            assert config.version == '1.0'
-            assert len(config.rules) == 4
-            assert config.global_settings['case_sensitive'] is True
-            assert config.global_settings['max_rules'] == 50
-
-            # 규칙 타입별 검증
-            assert config.rules[0].filter_type == 'group'
-            assert config.rules[1].filter_type == 'regex'
-            assert config.rules[2].filter_type == 'wildcard'
-            assert config.rules[3].filter_type == 'plain_keyword'
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_load_config_from_file_auto_detect_yaml(self):
-        """파일 확장자 자동 감지 테스트 (.yaml)"""
-        yaml_content = """
+""",
+        {
+            'global_settings': {'case_sensitive': True, 'max_rules': 50},
+            'rules': [
+                {'filter_type': 'group'},
+                {'filter_type': 'regex', 'pattern': '\\d{4}_\\d{2}_\\d{2}'},
+                {'filter_type': 'wildcard', 'enabled': False},
+                {'filter_type': 'plain_keyword'},
+            ],
+        },
+        id='mixed',
+    ),
+    # 유니코드 내용
+    pytest.param(
+        """
 version: "1.0"
+global_settings:
+  description: "한글 설명이 포함된 설정"
 rules:
   - filter_type: "plain_keyword"
-    pattern: "test"
+    pattern: "한글키워드"
     priority: 50
     enabled: true
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-
-            config = load_config_from_file(f.name)
-
-            assert config.version == '1.0'
-            assert len(config.rules) == 1
-            assert config.rules[0].pattern == 'test'
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_load_config_from_file_auto_detect_yml(self):
-        """파일 확장자 자동 감지 테스트 (.yml)"""
-        yaml_content = """
+    description: "한글 키워드 제거"
+  - filter_type: "replace"
+    pattern: "나쁜말"
+    replacement: "좋은말"
+    priority: 40
+    enabled: true
+    description: "한글 단어 치환"
+""",
+        {
+            'global_settings': {'description': '한글 설명이 포함된 설정'},
+            'rules': [
+                {'pattern': '한글키워드', 'description': '한글 키워드 제거'},
+                {'pattern': '나쁜말', 'replacement': '좋은말', 'description': '한글 단어 치환'},
+            ],
+        },
+        id='unicode',
+    ),
+    # YAML 불린 값 (yes/no도 true/false로 해석됨)
+    pytest.param(
+        """
 version: "1.0"
+global_settings:
+  case_sensitive: true
+  debug_mode: false
 rules:
   - filter_type: "plain_keyword"
-    pattern: "test"
+    pattern: "test1"
     priority: 50
-    enabled: true
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-
-            config = load_config_from_file(f.name)
-
-            assert config.version == '1.0'
-            assert len(config.rules) == 1
-            assert config.rules[0].pattern == 'test'
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_invalid_yaml_format(self):
-        """잘못된 YAML 형식 테스트"""
-        invalid_yaml = """
+    enabled: yes
+  - filter_type: "plain_keyword"
+    pattern: "test2"
+    priority: 40
+    enabled: no
+""",
+        {
+            'global_settings': {'case_sensitive': True, 'debug_mode': False},
+            'rules': [{'pattern': 'test1', 'enabled': True}, {'pattern': 'test2', 'enabled': False}],
+        },
+        id='boolean',
+    ),
+]
+
+# 잘못된 YAML 설정 케이스: YAML 문서, 예외 타입, 오류 메시지 패턴
+ERROR_CASES = [
+    pytest.param(
+        """
+version: "1.0"
+rules:
+  - filter_type: "plain_keyword"
+    pattern: "test"
+   priority: 50
+""",
+        yaml.YAMLError,
+        None,
+        id='invalid_format',
+    ),
+    pytest.param(
+        """
 version: "1.0"
 rules:
   - filter_type: "plain_keyword"
     pattern: "test"
     priority: 50
   - invalid_indentation
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(invalid_yaml)
-            f.flush()
-
-            # YAML 파싱 오류가 발생해야 함
-            with pytest.raises(Exception):  # yaml.YAMLError 또는 다른 파싱 오류
-                ConfigLoader.load_from_yaml(f.name)
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_invalid_filter_type(self):
-        """잘못된 필터 타입 테스트"""
-        yaml_content = """
+""",
+        ValueError,
+        'Input should be a dictionary',
+        id='rule_not_mapping',
+    ),
+    pytest.param(
+        """
 version: "1.0"
 rules:
   - filter_type: "invalid_type"
     pattern: "test"
     priority: 50
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-
-            with pytest.raises(ValueError, match='Invalid filter type'):
-                ConfigLoader.load_from_yaml(f.name)
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_invalid_priority(self):
-        """잘못된 우선순위 테스트"""
-        yaml_content = """
+""",
+        InvalidFilterTypeError,
+        None,
+        id='invalid_filter_type',
+    ),
+    pytest.param(
+        """
 version: "1.0"
 rules:
   - filter_type: "plain_keyword"
     pattern: "test"
     priority: -10
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-
-            with pytest.raises(ValueError, match='Priority must be non-negative'):
-                ConfigLoader.load_from_yaml(f.name)
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_empty_group_patterns(self):
-        """빈 그룹 패턴 테스트"""
-        yaml_content = """
+""",
+        NegativePriorityError,
+        None,
+        id='invalid_priority',
+    ),
+    pytest.param(
+        """
 version: "1.0"
 rules:
   - filter_type: "group"
     patterns: []
     priority: 50
-"""
+""",
+        ValueError,
+        'Group filter must have at least one pattern',
+        id='empty_group_patterns',
+    ),
+]
+
+
+class TestYamlConfigLoading:
+    """YAML 파일 설정 로딩 테스트"""
+
+    @pytest.mark.parametrize('yaml_content, expected', LOAD_CASES)
+    def test_load_rules(self, yaml_content: str, expected: Dict[str, Any]):
+        """규칙 종류별 YAML 설정 로딩 테스트"""
+        config = ConfigLoader.load_from_yaml_string(yaml_content)
+
+        assert config.version == '1.0'
+        assert config.global_settings == expected.get('global_settings', {})
+        assert len(config.rules) == len(expected['rules'])
+        for rule, expected_rule in zip(config.rules, expected['rules']):
+            for field, value in expected_rule.items():
+                assert getattr(rule, field) == value, (field, rule)
+
+    @pytest.mark.parametrize('yaml_content, exception, match', ERROR_CASES)
+    def test_load_raises(self, yaml_content: str, exception: Type[Exception], match: Optional[str]):
+        """잘못된 YAML 설정을 로드하면 오류가 발생하는지 테스트"""
+        with pytest.raises(exception, match=match):
+            ConfigLoader.load_from_yaml_string(yaml_content)
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
+    @pytest.mark.parametrize('suffix', ['.yaml', '.yml'])
+    def test_load_config_from_file_auto_detect(self, tmp_path: Path, suffix: str):
+        """파일 확장자 자동 감지 테스트 (.yaml, .yml)"""
+        file_path = tmp_path / f'config{suffix}'
+        file_path.write_text(SINGLE_RULE_YAML, encoding='utf-8')
 
-            with pytest.raises(ValueError, match='Group filter must have at least one pattern'):
-                ConfigLoader.load_from_yaml(f.name)
+        config = load_config_from_file(file_path)
 
-            # 파일 정리
-            Path(f.name).unlink()
+        assert config.version == '1.0'
+        assert len(config.rules) == 1
+        assert config.rules[0].pattern == 'test'
 
     def test_file_not_found(self):
         """파일이 존재하지 않는 경우 테스트"""
         with pytest.raises(FileNotFoundError):
             ConfigLoader.load_from_yaml('nonexistent_file.yaml')
 
-    def test_yaml_import_error(self):
+    def test_yaml_import_error(self, tmp_path: Path):
         """PyYAML이 설치되지 않은 경우 테스트"""
         # 이 테스트는 실제로는 PyYAML이 설치되어 있어야 하므로
         # 모킹을 통해 ImportError를 시뮬레이션할 수 있지만
@@ -384,203 +361,188 @@ rules:
     priority: 50
 """
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
+        file_path = tmp_path / 'config.yaml'
+        file_path.write_text(yaml_content, encoding='utf-8')
 
-            # PyYAML이 설치되어 있다면 정상 동작해야 함
-            try:
-                config = ConfigLoader.load_from_yaml(f.name)
-                assert config.version == '1.0'
-            except ImportError as e:
-                # PyYAML이 설치되지 않은 경우
-                assert 'PyYAML is required' in str(e)
-
-            # 파일 정리
-            Path(f.name).unlink()
+        # PyYAML이 설치되어 있다면 정상 동작해야 함
+        try:
+            config = ConfigLoader.load_from_yaml(file_path)
+            assert config.version == '1.0'
+        except ImportError as e:
+            # PyYAML이 설치되지 않은 경우
+            assert 'PyYAML is required' in str(e)
 
-    def test_get_enabled_rules(self):
+    def test_get_enabled_rules(self, sample_yaml_config: TagFilterConfig):
         """활성화된 규칙만 가져오기 테스트"""
-        yaml_content = """
-version: "1.0"
-rules:
-  - filter_type: "plain_keyword"
-    pattern: "enabled_rule"
-    priority: 50
-    enabled: true
-  - filter_type: "plain_keyword"
-    pattern: "disabled_rule"
-    priority: 40
-    enabled: false
-  - filter_type: "regex"
-    pattern: "\\\\btest\\\\b"
-    priority: 30
-    enabled: true
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
+        enabled_rules = sample_yaml_config.get_enabled_rules()
 
-            config = ConfigLoader.load_from_yaml(f.name)
-            enabled_rules = config.get_enabled_rules()
+        assert [rule.enabled for rule in enabled_rules] == [True, True, True]
+        assert enabled_rules[0].pattern == 'enabled_rule'
+        assert enabled_rules[1].pattern == '\\btest\\b'
+        assert isinstance(enabled_rules[2], GroupFilterRuleRecord)
 
-            assert len(enabled_rules) == 2
-            assert enabled_rules[0].pattern == 'enabled_rule'
-            assert enabled_rules[1].pattern == '\\btest\\b'
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_get_rules_by_priority(self):
+    def test_get_rules_by_priority(self, sample_yaml_config: TagFilterConfig):
         """우선순위 순으로 정렬된 규칙 가져오기 테스트"""
-        yaml_content = """
-version: "1.0"
-rules:
-  - filter_type: "plain_keyword"
-    pattern: "low_priority"
-    priority: 10
-    enabled: true
-  - filter_type: "plain_keyword"
-    pattern: "high_priority"
-    priority: 100
-    enabled: true
-  - filter_type: "regex"
-    pattern: "medium_priority"
-    priority: 50
-    enabled: true
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
+        sorted_rules = sample_yaml_config.get_rules_by_priority()
 
-            config = ConfigLoader.load_from_yaml(f.name)
-            sorted_rules = config.get_rules_by_priority()
+        assert [rule.priority for rule in sorted_rules] == [60, 50, 40, 30]
+        assert sorted_rules[1].pattern == 'enabled_rule'
+        assert sorted_rules[2].pattern == 'disabled_rule'
+        assert sorted_rules[3].pattern == '\\btest\\b'
 
-            assert len(sorted_rules) == 3
-            assert sorted_rules[0].pattern == 'high_priority'
-            assert sorted_rules[0].priority == 100
-            assert sorted_rules[1].pattern == 'medium_priority'
-            assert sorted_rules[1].priority == 50
-            assert sorted_rules[2].pattern == 'low_priority'
-            assert sorted_rules[2].priority == 10
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_to_filter_rules_conversion(self):
+    def test_to_filter_rules_conversion(self, sample_yaml_config: TagFilterConfig):
         """FilterRule 객체로 변환 테스트"""
-        yaml_content = """
-version: "1.0"
-rules:
-  - filter_type: "plain_keyword"
-    pattern: "test"
-    priority: 50
-    enabled: true
-    description: "테스트 규칙"
-  - filter_type: "group"
-    patterns:
-      - "a"
-      - "b"
-    priority: 60
-    enabled: true
-    description: "그룹 규칙"
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-
-            config = ConfigLoader.load_from_yaml(f.name)
-            filter_rules = config.to_filter_rules()
+        filter_rules = sample_yaml_config.to_filter_rules()
 
-            assert len(filter_rules) == 2
+        assert len(filter_rules) == 4
+        assert isinstance(filter_rules[0], FilterRule)
+        assert filter_rules[0].pattern == 'enabled_rule'
+        assert filter_rules[0].description == '테스트 규칙'
+        assert isinstance(filter_rules[3], GroupFilterRule)
+        assert filter_rules[3].patterns == ('a', 'b')
 
-            # 첫 번째 규칙은 FilterRule
-            from sd_tagfilter.base import FilterRule
-
-            assert isinstance(filter_rules[0], FilterRule)
-            assert filter_rules[0].pattern == 'test'
-
-            # 두 번째 규칙은 GroupFilterRule
-            from sd_tagfilter.base import GroupFilterRule
-
-            assert isinstance(filter_rules[1], GroupFilterRule)
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_yaml_with_unicode_content(self):
-        """유니코드 내용이 포함된 YAML 테스트"""
+    def test_pure_python_loader_fallback(self, monkeypatch: pytest.MonkeyPatch):
+        """libyaml이 없어 순수 Python 로더를 쓸 때도 같은 설정을 읽는지 확인"""
         yaml_content = """
 version: "1.0"
-global_settings:
-  description: "한글 설명이 포함된 설정"
 rules:
   - filter_type: "plain_keyword"
     pattern: "한글키워드"
     priority: 50
-    enabled: true
-    description: "한글 키워드 제거"
-  - filter_type: "replace"
-    pattern: "나쁜말"
-    replacement: "좋은말"
-    priority: 40
-    enabled: true
-    description: "한글 단어 치환"
+    enabled: yes
+  - filter_type: "group"
+    patterns: ["steam", "sweat"]
 """
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False, encoding='utf-8') as f:
-            f.write(yaml_content)
-            f.flush()
-
-            config = ConfigLoader.load_from_yaml(f.name)
-
-            assert config.version == '1.0'
-            assert len(config.rules) == 2
-            assert config.global_settings['description'] == '한글 설명이 포함된 설정'
-
-            # 첫 번째 규칙
-            assert config.rules[0].pattern == '한글키워드'
-            assert config.rules[0].description == '한글 키워드 제거'
-
-            # 두 번째 규칙
-            assert config.rules[1].pattern == '나쁜말'
-            assert config.rules[1].replacement == '좋은말'
-            assert config.rules[1].description == '한글 단어 치환'
-
-            # 파일 정리
-            Path(f.name).unlink()
-
-    def test_yaml_boolean_values(self):
-        """YAML 불린 값 처리 테스트"""
+        expected = ConfigLoader.load_from_yaml_string(yaml_content)
+
+        monkeypatch.delattr(yaml, 'CSafeLoader', raising=False)
+        clear_config_cache()
+        assert ConfigLoader.load_from_yaml_string(yaml_content) == expected
+
+    def test_event_walker_matches_safe_load(self):
+        """libyaml 이벤트에서 바로 만든 값이 SafeLoader 결과와 같고, 지원하지 않는 문서는 일반 로더로 넘기는지 확인"""
+        if not hasattr(yaml, 'CSafeLoader'):
+            pytest.skip('libyaml not available')
+        documents = [
+            '',
+            'rules: []',
+            'a: 1\nb: -0x1A\nc: 1_000\nd: 0o17\ne: 1.5e3\nf: .inf\ng: ~\nh: null\ni:',
+            'yes_no: [yes, no, on, off, True, FALSE]\nquoted: ["1", \'true\', "null"]',
+            'when: 2024-01-02\nstamp: 2024-01-02 03:04:05\nversion: 1.0\nname: "1.0"',
+            'nested:\n  - {a: [1, 2, {b: c}]}\n  - - x\n    - y\n1: int key\nnull: null key',
+            'text: |\n  line one\n  line two\nfolded: >\n  a\n  b\n',
+            '---\n- 한글\n- "\\u00e9"\n...\n',
+        ]
+        for document in documents:
+            assert _yaml_events_to_data(document) == yaml.safe_load(document), document
+
+        unsupported = [
+            'base: &base {priority: 1}\nrule: *base',
+            'base: &base {priority: 1}\nrule:\n  <<: *base',
+            'value: !!str 1',
+            'value: !!map {a: 1}',
+            '? [a, b]\n: value',
+            '---\na: 1\n---\nb: 2',
+            'rules:\n  - <<: {filter_type: plain_keyword, priority: 0}\n    pattern: cat',
+            'value: =',
+        ]
+        for document in unsupported:
+            with pytest.raises(_UnsupportedYamlFeature):
+                _yaml_events_to_data(document)
+
+        # 여러 문서는 일반 로더에서도 오류
+        with pytest.raises(yaml.YAMLError):
+            ConfigLoader.load_from_yaml_string('---\nrules: []\n---\nrules: []')
+        # 별칭을 쓴 문서는 일반 로더로 다시 읽음
+        config = ConfigLoader.load_from_yaml_string(
+            'defaults: &defaults {filter_type: plain_keyword, priority: 5}\n'
+            'rules:\n  - <<: *defaults\n    pattern: nsfw\n'
+        )
+        assert config.rules[0].pattern == 'nsfw'
+        assert config.rules[0].priority == 5
+        # 별칭 없는 병합 키도 일반 로더로 다시 읽음
+        config = ConfigLoader.load_from_yaml_string(
+            'rules:\n  - <<: {filter_type: plain_keyword, priority: 0}\n    pattern: cat\n'
+        )
+        assert config.rules[0].pattern == 'cat'
+        # 기본 스칼라가 아닌 = 값은 일반 로더와 같이 YAML 오류
+        with pytest.raises(yaml.YAMLError):
+            ConfigLoader.load_from_yaml_string('rules:\n  - pattern: =\n')
+
+    def test_yaml_imported_lazily(self):
+        """패키지를 import할 때는 PyYAML을 불러오지 않고 YAML을 처음 읽을 때 불러오는지 확인"""
+        code = (
+            'import sys, sd_tagfilter; assert "yaml" not in sys.modules; '
+            'sd_tagfilter.ConfigLoader.load_from_yaml_string("rules: []"); assert "yaml" in sys.modules'
+        )
+        subprocess.run([sys.executable, '-c', code], check=True, cwd=Path(__file__).parent.parent)
+
+    def test_loading_does_not_compile_patterns(self, monkeypatch: pytest.MonkeyPatch):
+        """설정 로드/검증 단계에서는 정규식을 컴파일하지 않고 필터 생성 시 캐시를 통해 컴파일하는지 확인"""
         yaml_content = """
-version: "1.0"
-global_settings:
-  case_sensitive: true
-  debug_mode: false
 rules:
-  - filter_type: "plain_keyword"
-    pattern: "test1"
-    priority: 50
-    enabled: yes  # YAML에서 yes는 true로 해석됨
-  - filter_type: "plain_keyword"
-    pattern: "test2"
-    priority: 40
-    enabled: no   # YAML에서 no는 false로 해석됨
+  - filter_type: "regex"
+    pattern: "\\\\d{4}_uncompiled"
 """
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-
-            config = ConfigLoader.load_from_yaml(f.name)
-
-            assert config.global_settings['case_sensitive'] is True
-            assert config.global_settings['debug_mode'] is False
-            assert config.rules[0].enabled is True
-            assert config.rules[1].enabled is False
-
-            # 파일 정리
-            Path(f.name).unlink()
+        def fail_compile(*args: object, **kwargs: object):
+            raise AssertionError('pattern compiled while loading config')
+
+        clear_config_cache()
+        with monkeypatch.context() as patch:
+            patch.setattr(re, 'compile', fail_compile)
+            config = ConfigLoader.load_from_yaml_string(yaml_content)
+
+        assert config.rules[0].pattern == '\\d{4}_uncompiled'
+
+    def test_load_from_yaml_bytes(self):
+        """인코딩된 바이트를 넘겨도 문자열과 같은 설정을 읽는지 확인"""
+        expected = ConfigLoader.load_from_yaml_string(SINGLE_RULE_YAML)
+
+        assert ConfigLoader.load_from_yaml_string(SINGLE_RULE_YAML.encode()) == expected
+        assert ConfigLoader.load_from_yaml_string(SINGLE_RULE_YAML.encode('utf-16')) == expected
+
+    def test_load_from_open_file(self, tmp_path: Path):
+        """열린 파일 객체를 넘기면 파일을 다시 열지 않고 현재 위치부터 읽는지 확인"""
+        expected = ConfigLoader.load_from_yaml_string(SINGLE_RULE_YAML)
+        file_path = tmp_path / 'config.yaml'
+        file_path.write_text(SINGLE_RULE_YAML, encoding='utf-8')
+
+        with open(file_path, 'rb') as f:
+            assert ConfigLoader.load_from_yaml(f) == expected
+        with open(file_path, encoding='utf-8') as f:
+            assert ConfigLoader.load_from_yaml(f) == expected
+
+        # 별칭 때문에 다시 파싱해도 파일 앞쪽의 다른 내용은 읽지 않음
+        with open(file_path, 'w+', encoding='utf-8') as f:
+            f.write('ignored: [\n')
+            start = f.tell()
+            f.write('d: &d {filter_type: plain_keyword, pattern: test}\nrules: [*d]\n')
+            f.seek(start)
+            assert [rule.pattern for rule in ConfigLoader.load_from_yaml(f).rules] == ['test']
+
+    def test_unchanged_yaml_is_not_reparsed(self, tmp_path: Path):
+        """같은 YAML 파일/문자열은 다시 파싱하지 않고, 반환된 설정을 수정해도 캐시에 영향이 없는지 확인"""
+        clear_config_cache()
+        file_path = tmp_path / 'config.yaml'
+        file_path.write_text(SINGLE_RULE_YAML, encoding='utf-8')
+
+        first = ConfigLoader.load_from_yaml(file_path)
+        rule = first.rules[0]
+        assert isinstance(rule, FilterRuleRecord)
+        rule.pattern = 'other'
+        assert [rule.pattern for rule in ConfigLoader.load_from_yaml(file_path).rules] == ['test']
+        first.rules.clear()
+        assert [rule.pattern for rule in ConfigLoader.load_from_yaml(file_path).rules] == ['test']
+
+        config = ConfigLoader.load_from_yaml_string(SINGLE_RULE_YAML)
+        config.rules[0].priority = 99
+        config.rules[0].enabled = False
+        config.global_settings['changed'] = True
+        second = ConfigLoader.load_from_yaml_string(SINGLE_RULE_YAML)
+        assert [(rule.priority, rule.enabled) for rule in second.rules] == [(50, True)]
+        assert second.global_settings == {}
+        assert _load_yaml_content.cache_info().hits == 1
+
+        clear_config_cache()
+        assert _load_yaml_content.cache_info().currsize == 0